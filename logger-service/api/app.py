@@ -9,6 +9,15 @@ from .routes.stats_routes import create_stats_bp
 from .routes.logs_routes import create_logs_bp
 from .routes.log_endpoint import create_log_bp
 from .routes.error_handlers import  register_error_handlers
+from .json_provider import OrjsonProvider
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = BASE_DIR / 'templates'
+STATIC_DIR = BASE_DIR / 'static'
+
+# Metadata and config bodies are a few hundred bytes; larger requests are
+# rejected with 413 by Werkzeug before the body is read or parsed
+MAX_CONTENT_LENGTH = 64 * 1024
 
 
 def create_app(config, logger):
@@ -22,18 +31,16 @@ def create_app(config, logger):
     Returns:
         Flask: The configured application
     """
-    base_dir = Path(__file__).parent.parent
-
-    template_dir = base_dir / 'templates'
-    static_dir = base_dir / 'static'
-
     app = Flask(
         __name__,
-        template_folder=str(template_dir),
-        static_folder=str(static_dir)
+        template_folder=str(TEMPLATE_DIR),
+        static_folder=str(STATIC_DIR)
     )
 
-    app.config['JSON_AS_ASCII'] = False
+    # orjson writes UTF-8 directly, so no JSON_AS_ASCII setting is needed
+    app.json = OrjsonProvider(app)
+
+    app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
     # Saving configuration in the application context
     app.config['LOGGER_CONFIG'] = config
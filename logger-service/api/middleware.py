@@ -14,6 +14,7 @@ What it does:
 What it does:
 - Checks that the request contains JSON
 - Checks for required fields in the JSON
+- Adds the parsed JSON to the request object for use in the route
 """
 
 from functools import wraps
@@ -69,10 +70,12 @@ def validate_json(*required_fields):
         @app.route('/log', methods=['POST'])
         @validate_json('filename', 'created_at', 'file_size')
         def log_metadata():
-            data = request.get_json()
+            data = request.json_payload
             # data is guaranteed to contain all required_fields
     """
 
+    required_set = frozenset(required_fields)
+
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
@@ -80,13 +83,18 @@ def validate_json(*required_fields):
                 return jsonify({'error': 'Content-Type must be application/json'}), 400
 
             data = request.get_json()
-            missing = [field for field in required_fields if field not in data]
+            missing = required_set.difference(data)
 
             if missing:
+                # Report in declaration order
+                missing = [field for field in required_fields if field in missing]
                 error_msg = f"Missing required fields: {', '.join(missing)}"
                 logger.warning(f"❌ {error_msg}")
                 return jsonify({'error': error_msg}), 400
 
+            # Add the parsed body to the request so the route does not parse it again
+            request.json_payload = data
+
             return f(*args, **kwargs)
 
         return decorated_function
@@ -4,12 +4,32 @@ API endpoints for configuration management
 
 import copy
 import logging
-import yaml
 from pathlib import Path
-from flask import Blueprint, request, jsonify, render_template
+from flask import Blueprint, Response, request, jsonify, render_template, current_app
+from core.config import save_config_async
+from utils.formatters import utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent.parent / 'templates'
+
+# Served on / when the Web UI template is missing
+WEB_UI_FALLBACK = {
+    'service': 'logger-service',
+    'message': 'Web UI not available. Create templates/config.html to enable.',
+    'endpoints': {
+        'health': '/health',
+        'log': '/log (POST)',
+        'config': '/api/config (GET)',
+        'update_config': '/api/config/<section> (PUT)',
+        'stats': '/api/stats (GET)',
+        'recent_logs': '/api/logs/recent (GET)'
+    }
+}
+
+# Spliced into the cached /health body in place of the current time
+TIMESTAMP_PLACEHOLDER = '__timestamp__'
+
 
 def create_config_bp(config, app_logger):
     """
@@ -24,49 +44,68 @@ def create_config_bp(config, app_logger):
     """
     config_bp = Blueprint('config', __name__)
 
+    # Serialized response bodies are reused until the config is updated
+    config_version = {'value': 0}
+    response_cache = {}
+
+    # Rendered HTML pages, keyed by page name
+    rendered_pages = {}
+
+    def cached_body(key, build):
+        """Returns the cached JSON body for key, rebuilding it after a config update"""
+        cached = response_cache.get(key)
+        if cached is None or cached[0] != config_version['value']:
+            body = current_app.json.dumps(build()).encode('utf-8')
+            cached = (config_version['value'], body)
+            response_cache[key] = cached
+        return cached[1]
+
+    def build_safe_config():
+        """Copy of the configuration with secrets hidden"""
+        safe_config = copy.deepcopy(config)
+        if 'jwt' in safe_config and 'secret' in safe_config['jwt']:
+            safe_config['jwt']['secret'] = '***hidden***'
+        if 'notifications' in safe_config:
+            if 'email' in safe_config['notifications']:
+                if 'password' in safe_config['notifications']['email']:
+                    safe_config['notifications']['email']['password'] = '***hidden***'
+        return safe_config
+
+    # Checked once instead of catching a failed render on every request
+    has_template = (TEMPLATES_DIR / 'config.html').is_file()
+    if not has_template:
+        app_logger.debug(f"Template not found: {TEMPLATES_DIR / 'config.html'}")
+
     @config_bp.route('/', methods=['GET'])
     def index():
         """Web UI homepage"""
-        try:
-            return render_template('config.html')
-        except Exception as e:
-            app_logger.debug(f"Template not found: {e}")
-            return jsonify({
-                'service': 'logger-service',
-                'message': 'Web UI not available. Create templates/config.html to enable.',
-                'endpoints': {
-                    'health': '/health',
-                    'log': '/log (POST)',
-                    'config': '/api/config (GET)',
-                    'update_config': '/api/config/<section> (PUT)',
-                    'stats': '/api/stats (GET)',
-                    'recent_logs': '/api/logs/recent (GET)'
-                }
-            }), 200
+        if not has_template:
+            body = cached_body('index', lambda: WEB_UI_FALLBACK)
+            return Response(body, status=200, mimetype='application/json')
+
+        # The page only depends on static URLs, so it is rendered once
+        if 'index' not in rendered_pages:
+            rendered_pages['index'] = render_template('config.html').encode('utf-8')
+        return Response(rendered_pages['index'], status=200, mimetype='text/html')
 
     @config_bp.route('/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
-        from datetime import datetime, timezone
-
-        return jsonify({
+        template = cached_body('health', lambda: {
             'status': 'healthy',
             'service': config['service']['name'],
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }), 200
+            'timestamp': TIMESTAMP_PLACEHOLDER
+        })
+        timestamp = utc_timestamp()
+        body = template.replace(TIMESTAMP_PLACEHOLDER.encode('ascii'), timestamp.encode('ascii'))
+
+        return Response(body, status=200, mimetype='application/json')
 
     @config_bp.route('/api/config', methods=['GET'])
     def get_config():
         """Get the current configuration"""
-        safe_config = copy.deepcopy(config)
-        if 'jwt' in safe_config and 'secret' in safe_config['jwt']:
-            safe_config['jwt']['secret'] = '***hidden***'
-        if 'notifications' in safe_config:
-            if 'email' in safe_config['notifications']:
-                if 'password' in safe_config['notifications']['email']:
-                    safe_config['notifications']['email']['password'] = '***hidden***'
-
-        return jsonify(safe_config), 200
+        body = cached_body('config', build_safe_config)
+        return Response(body, status=200, mimetype='application/json')
 
     @config_bp.route('/api/config/<section>', methods=['PUT'])
     def update_config(section):
@@ -97,6 +136,7 @@ def create_config_bp(config, app_logger):
                 config[section].update(data)
             else:
                 config[section] = data
+            config_version['value'] += 1
 
             # Apply logging level changes immediately
             if section == 'logging' and 'level' in data:
@@ -109,10 +149,8 @@ def create_config_bp(config, app_logger):
 
                 app_logger.info(f"Log level changed to {data['level']} (applied immediately)")
 
-            # Save to file
-            config_path = Path(__file__).parent.parent.parent / 'config.yaml'
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+            # Save to file in the background
+            save_config_async(config)
 
             app_logger.info(f"Configuration section '{section}' updated")
             return jsonify({
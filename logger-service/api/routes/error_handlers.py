@@ -2,7 +2,6 @@
 Flask error handlers
 """
 
-from flask import jsonify
 from services.notification_service import send_email_notification
 
 
@@ -16,17 +15,34 @@ def register_error_handlers(app, config, logger):
         logger: Logger object
     """
 
+    # Bodies are serialized once; each response only wraps the prebuilt bytes
+    bodies = {
+        status: app.json.dumps({'error': message}).encode('utf-8')
+        for status, message in (
+            (400, 'Bad request'),
+            (401, 'Unauthorized'),
+            (403, 'Forbidden'),
+            (404, 'Endpoint not found'),
+            (413, 'Payload too large'),
+            (500, 'Internal server error')
+        )
+    }
+
+    def error_response(status):
+        """Builds a JSON error response from the prebuilt body"""
+        return app.response_class(bodies[status], status=status, mimetype='application/json')
+
     @app.errorhandler(404)
     def not_found(error):
         """Handles 404 Not Found errors"""
-        return jsonify({'error': 'Endpoint not found'}), 404
+        return error_response(404)
 
     @app.errorhandler(500)
     def internal_error(error):
         """Handles 500 Internal Server Error"""
         logger.error(f"Internal server error: {error}")
 
-        # Send error notification
+        # Queued for the background email sender
         send_email_notification(
             config,
             "Internal Server Error",
@@ -34,19 +50,24 @@ def register_error_handlers(app, config, logger):
             logger
         )
 
-        return jsonify({'error': 'Internal server error'}), 500
+        return error_response(500)
 
     @app.errorhandler(400)
     def bad_request(error):
         """Handles 400 Bad Request errors"""
-        return jsonify({'error': 'Bad request'}), 400
+        return error_response(400)
 
     @app.errorhandler(401)
     def unauthorized(error):
         """Handles 401 Unauthorized errors"""
-        return jsonify({'error': 'Unauthorized'}), 401
+        return error_response(401)
 
     @app.errorhandler(403)
     def forbidden(error):
         """Handles 403 Forbidden errors"""
-        return jsonify({'error': 'Forbidden'}), 403
+        return error_response(403)
+
+    @app.errorhandler(413)
+    def payload_too_large(error):
+        """Handles 413 Payload Too Large errors"""
+        return error_response(413)
@@ -1,6 +1,7 @@
 """
-Main endpoint for receiving file metadata
+Endpoints for receiving file metadata
 POST /log
+POST /log/batch
 """
 
 import logging
@@ -8,11 +9,21 @@ from pathlib import Path
 from flask import Blueprint, request, jsonify
 from api.middleware import require_jwt, validate_json
 from core.log_manager import create_log_file
-from services.notification_service import send_email_notification, send_syslog_notification, SyslogLevel
+from services.notification_service import (
+    send_email_notification,
+    send_syslog_notification,
+    send_notification_async,
+    SyslogLevel
+)
 from utils.formatters import format_file_size
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_FIELDS = ('filename', 'created_at', 'file_size')
+
+# Entries accepted by /log/batch in one request
+MAX_BATCH_SIZE = 100
+
 
 def create_log_bp(config, app_logger):
     """
@@ -27,71 +38,143 @@ def create_log_bp(config, app_logger):
     """
     log_bp = Blueprint('log', __name__)
 
-    @log_bp.route('/log', methods=['POST'])
-    @require_jwt(config)
-    @validate_json('filename', 'created_at', 'file_size')
-    def log_metadata():
-        """
-        Main endpoint for receiving file metadata
+    def check_metadata(metadata):
+        """Additional type validation. Returns an error message or None"""
+        if not isinstance(metadata['filename'], str) or not metadata['filename']:
+            return 'filename must be a non-empty string'
 
-        Headers:
-            Authorization: Bearer <JWT>
+        if not isinstance(metadata['file_size'], int) or metadata['file_size'] < 0:
+            return 'file_size must be a non-negative integer'
 
-        Body:
-            {
-                "filename": "report.pdf",
-                "created_at": "2025-09-30T14:33:22Z",
-                "file_size": 204800,
-                "hash": "sha256..."
-            }
+        return None
 
-        Returns:
-            JSON response with status
+    def store_metadata(metadata):
         """
-        metadata = request.get_json()
-
-        # Additional type validation
-        if not isinstance(metadata['filename'], str) or not metadata['filename']:
-            return jsonify({'error': 'filename must be a non-empty string'}), 400
-
-        if not isinstance(metadata['file_size'], int) or metadata['file_size'] < 0:
-            return jsonify({'error': 'file_size must be a non-negative integer'}), 400
+        Creates the log file for validated metadata, notifying on failure
 
-        app_logger.info(
-            f"📝 Received metadata for file: {metadata['filename']} "
-            f"({format_file_size(metadata['file_size'])}) "
-            f"from {request.jwt_payload.get('iss')}"
-        )
+        Returns:
+            tuple: (success: bool, log file path or error message)
+        """
+        if app_logger.isEnabledFor(logging.INFO):
+            app_logger.info(
+                "📝 Received metadata for file: %s (%s) from %s",
+                metadata['filename'],
+                format_file_size(metadata['file_size']),
+                request.jwt_payload.get('iss')
+            )
 
         # ============ Create a log file ============
         success, result = create_log_file(metadata, config, app_logger)
 
         if not success:
-            app_logger.error(f"❌ Failed to create log file: {result}")
+            app_logger.error("❌ Failed to create log file: %s", result)
 
-            # Sending error notifications
+            # Sending error notifications in the background
             send_email_notification(
                 config,
                 "Log File Creation Failed",
                 f"Error: {result}\nMetadata: {metadata}",
                 app_logger
             )
-            send_syslog_notification(
+            send_notification_async(
+                send_syslog_notification,
                 config,
                 SyslogLevel.ERROR,
                 f"Log creation failed: {result}",
                 app_logger
             )
+            return False, result
 
+        app_logger.info("✅ Successfully processed file: %s", metadata['filename'])
+        return True, result
+
+    @log_bp.route('/log', methods=['POST'])
+    @require_jwt(config)
+    @validate_json(*REQUIRED_FIELDS)
+    def log_metadata():
+        """
+        Main endpoint for receiving file metadata
+
+        Headers:
+            Authorization: Bearer <JWT>
+
+        Body:
+            {
+                "filename": "report.pdf",
+                "created_at": "2025-09-30T14:33:22Z",
+                "file_size": 204800,
+                "hash": "sha256..."
+            }
+
+        Returns:
+            JSON response with status
+        """
+        metadata = request.json_payload
+
+        error = check_metadata(metadata)
+        if error:
+            return jsonify({'error': error}), 400
+
+        success, result = store_metadata(metadata)
+        if not success:
             return jsonify({'error': result}), 500
 
         # ============ Success ============
-        app_logger.info(f"✅ Successfully processed file: {metadata['filename']}")
-
         return jsonify({
             'status': 'success',
             'message': 'Metadata logged successfully',
             'log_file': Path(result).name
         }), 200
 
-    return log_bp
\ No newline at end of file
+    @log_bp.route('/log/batch', methods=['POST'])
+    @require_jwt(config)
+    def log_metadata_batch():
+        """
+        Receives metadata for several files in one request
+
+        Headers:
+            Authorization: Bearer <JWT>
+
+        Body:
+            JSON array of objects in the /log format (at most MAX_BATCH_SIZE)
+
+        Returns:
+            JSON response with one result per entry, in order:
+            {"status": "success"|"partial", "results": [{"status": "success", "log_file": ...}
+                                                        | {"status": "error", "error": ...}]}
+        """
+        if not request.is_json:
+            return jsonify({'error': 'Content-Type must be application/json'}), 400
+
+        entries = request.get_json()
+        if not isinstance(entries, list) or not entries:
+            return jsonify({'error': 'Body must be a non-empty JSON array'}), 400
+
+        if len(entries) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'At most {MAX_BATCH_SIZE} entries per batch'}), 400
+
+        results = []
+        for metadata in entries:
+            if not isinstance(metadata, dict):
+                results.append({'status': 'error', 'error': 'Entry must be a JSON object'})
+                continue
+
+            missing = [field for field in REQUIRED_FIELDS if field not in metadata]
+            error = f"Missing required fields: {', '.join(missing)}" if missing else check_metadata(metadata)
+            if error:
+                results.append({'status': 'error', 'error': error})
+                continue
+
+            success, result = store_metadata(metadata)
+            if success:
+                results.append({'status': 'success', 'log_file': Path(result).name})
+            else:
+                results.append({'status': 'error', 'error': result})
+
+        all_ok = all(result['status'] == 'success' for result in results)
+        return jsonify({
+            'status': 'success' if all_ok else 'partial',
+            'results': results
+        }), 200
+
+    return log_bp
@@ -5,6 +5,7 @@ API endpoints for working with logs
 import logging
 from pathlib import Path
 from flask import Blueprint, jsonify
+from utils.log_reader import read_last_lines
 
 logger = logging.getLogger(__name__)
 
@@ -32,18 +33,22 @@ def create_logs_bp(config, app_logger):
             if not log_file.exists():
                 return jsonify([]), 200
 
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[-50:]  # Последние 50 строк
+            lines = read_last_lines(log_file, 50)  # Последние 50 строк
 
             logs = []
             for line in lines:
-                parts = line.split(' - ')
-                if len(parts) >= 3:
-                    logs.append({
-                        'timestamp': parts[0],
-                        'level': parts[2].strip(),
-                        'message': ' - '.join(parts[3:]).strip()
-                    })
+                # Format: timestamp - name - level - message
+                timestamp, _, rest = line.partition(' - ')
+                _, found, rest = rest.partition(' - ')
+                if not found:
+                    continue
+
+                level, _, message = rest.partition(' - ')
+                logs.append({
+                    'timestamp': timestamp,
+                    'level': level.strip(),
+                    'message': message.strip()
+                })
 
             return jsonify(logs), 200
 
@@ -2,13 +2,59 @@
 API endpoints for statistics
 """
 
+import os
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
 
 logger = logging.getLogger(__name__)
 
+# All fields are numbers, so the body is formatted directly instead of going through jsonify
+STATS_BODY = b'{"total_logs":%d,"today_logs":%d,"storage_mb":%.2f}'
+
+# Record counts of daily aggregate files (storage.aggregate_daily): path -> (size, lines).
+# The files are append-only, so only bytes added since the last request are counted
+_daily_counts = {}
+_daily_counts_lock = threading.Lock()
+
+
+def _count_daily_records(path, size, block_size=1 << 20):
+    """
+    Counts the records (lines) in a daily aggregate file
+
+    Args:
+        path (str): Path to the .ndjson file
+        size (int): Current file size
+        block_size (int): Bytes read per step
+
+    Returns:
+        int: Number of records
+    """
+    with _daily_counts_lock:
+        counted_size, lines = _daily_counts.get(path, (0, 0))
+
+    # A file that shrank was replaced; it is counted again from the start
+    if size < counted_size:
+        counted_size, lines = 0, 0
+
+    if size > counted_size:
+        with open(path, 'rb') as f:
+            f.seek(counted_size)
+            remaining = size - counted_size
+            while remaining > 0:
+                chunk = f.read(min(block_size, remaining))
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                remaining -= len(chunk)
+
+    with _daily_counts_lock:
+        _daily_counts[path] = (size, lines)
+
+    return lines
+
 
 def create_stats_bp(config, app_logger):
     """
@@ -30,31 +76,49 @@ def create_stats_bp(config, app_logger):
             logs_dir = Path(config['storage']['logs_directory'])
 
             if not logs_dir.exists():
-                return jsonify({
-                    'total_logs': 0,
-                    'today_logs': 0,
-                    'storage_mb': 0
-                }), 200
-
-            log_files = list(logs_dir.glob('*.txt'))
-            total_logs = len(log_files)
-
-            # Count today’s logs
-            today = datetime.now(timezone.utc).date()
-            today_logs = sum(
-                1 for f in log_files
-                if datetime.fromtimestamp(f.stat().st_mtime, tz=timezone.utc).date() == today
-            )
-
-            # Calculate storage used
-            storage_bytes = sum(f.stat().st_size for f in log_files)
+                return Response(STATS_BODY % (0, 0, 0), status=200, mimetype='application/json')
+
+            # Single directory pass: count, today’s logs and storage used (.txt files and daily .ndjson files)
+            total_logs = 0
+            today_logs = 0
+            storage_bytes = 0
+
+            # Today's UTC window in epoch seconds, so the loop only compares numbers
+            now = datetime.now(timezone.utc)
+            today_start = datetime(now.year, now.month, now.day, tzinfo=timezone.utc).timestamp()
+            today_end = today_start + 86400
+
+            daily_paths = set()
+
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    is_daily = entry.name.endswith('.ndjson')
+                    if not (is_daily or entry.name.endswith('.txt')) or not entry.is_file():
+                        continue
+
+                    stat = entry.stat()
+                    storage_bytes += stat.st_size
+
+                    # A daily aggregate file holds one log record per line
+                    if is_daily:
+                        daily_paths.add(entry.path)
+                        records = _count_daily_records(entry.path, stat.st_size)
+                    else:
+                        records = 1
+
+                    total_logs += records
+                    if today_start <= stat.st_mtime < today_end:
+                        today_logs += records
+
+            # Forget files that were removed by retention
+            with _daily_counts_lock:
+                for path in _daily_counts.keys() - daily_paths:
+                    del _daily_counts[path]
+
             storage_mb = storage_bytes / (1024 * 1024)
 
-            return jsonify({
-                'total_logs': total_logs,
-                'today_logs': today_logs,
-                'storage_mb': round(storage_mb, 2)
-            }), 200
+            body = STATS_BODY % (total_logs, today_logs, storage_mb)
+            return Response(body, status=200, mimetype='application/json')
 
         except Exception as e:
             app_logger.error(f"Failed to get stats: {e}")
@@ -1,7 +1,7 @@
 # core/__init__.py
 """Core module"""
-from .config import load_config
+from .config import load_config, save_config, save_config_async
 from .logger import setup_logging
 from .log_manager import create_log_file, sanitize_filename
 
-__all__ = ['load_config', 'setup_logging', 'create_log_file', 'sanitize_filename']
\ No newline at end of file
+__all__ = ['load_config', 'save_config', 'save_config_async', 'setup_logging', 'create_log_file', 'sanitize_filename']
\ No newline at end of file
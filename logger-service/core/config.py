@@ -1,10 +1,27 @@
 """Configuration management"""
 import os
+import copy
+import logging
+import tempfile
 import yaml
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
+# LibYAML bindings are much faster; fall back to the pure-Python classes
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / 'config.yaml'
+
+# A single worker keeps config writes ordered
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='config-writer')
+
 
 def load_config(config_path=None):
     """Loads configuration from config.yaml and environment variables"""
@@ -16,11 +33,11 @@ def load_config(config_path=None):
         load_dotenv()
     #---
     if config_path is None:
-        config_path = Path(__file__).parent.parent / 'config.yaml'
+        config_path = DEFAULT_CONFIG_PATH
 
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
 
         # JWT Secret
         jwt_secret = os.getenv('JWT_SECRET')
@@ -37,6 +54,9 @@ def load_config(config_path=None):
         if os.getenv('LOGGER_PORT'):
             config['service']['port'] = int(os.getenv('LOGGER_PORT'))
 
+        if os.getenv('LOGGER_THREADS'):
+            config['service']['threads'] = int(os.getenv('LOGGER_THREADS'))
+
         if os.getenv('LOG_LEVEL'):
             config['logging']['level'] = os.getenv('LOG_LEVEL')
 
@@ -51,3 +71,44 @@ def load_config(config_path=None):
     except yaml.YAMLError as e:
         print(f"❌ YAML parsing error: {e}")
         exit(1)
+
+
+def save_config(config, config_path=None):
+    """Writes the configuration to config.yaml atomically (temp file + os.replace)"""
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+
+    config_dir = Path(config_path).parent
+    fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix='.config-', suffix='.yaml')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
+        if os.path.exists(config_path):
+            os.chmod(tmp_path, os.stat(config_path).st_mode & 0o777)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_config_async(config, config_path=None):
+    """
+    Schedules save_config on the background writer so the caller does not block on disk IO.
+
+    The configuration is snapshotted first, so later in-memory updates
+    do not race with serialization.
+
+    Returns:
+        concurrent.futures.Future
+    """
+    snapshot = copy.deepcopy(config)
+    future = _save_executor.submit(save_config, snapshot, config_path)
+    future.add_done_callback(_log_save_failure)
+    return future
+
+
+def _log_save_failure(future):
+    """Reports errors from a background config write"""
+    error = future.exception()
+    if error:
+        logger.error(f"Failed to save config: {error}")
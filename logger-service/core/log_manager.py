@@ -1,52 +1,277 @@
 """Log File Management"""
+import os
 import re
+import json
+import time
+import heapq
+import string
+import threading
 from pathlib import Path
-from datetime import datetime, timezone
-from utils.formatters import format_file_size, format_timestamp_for_filename
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from core.log_writer import get_log_writer, write_file
+from utils.formatters import format_file_size, format_timestamp_for_filename, utc_timestamp
+
+# Above this many queued background writes, requests wait for their own write (backpressure)
+ASYNC_WRITE_HIGH_WATERMARK = 10000
+
+# Min-heap of (mtime, path) for known log files, so max_files is enforced without
+# scanning the directory. _known_mtimes holds the live mtime per path; heap entries
+# that do not match it were superseded by an overwrite and are skipped.
+# Seeded from disk on first use and again whenever logs_directory changes.
+_known_heap = []
+_known_mtimes = {}
+_known_dir = None
+_known_lock = threading.Lock()
+
+# Background writes accepted but not finished yet. They are indexed only once
+# written, so without cleanup they are counted against max_files separately
+_pending_writes = 0
+
+# Daily aggregate file (storage.aggregate_daily): one NDJSON line per request,
+# appended through a descriptor that is reopened when the UTC date or directory changes
+_daily_fd = None
+_daily_key = None
+_daily_lock = threading.Lock()
+
+# Runs of unsafe characters and underscores, collapsed to a single '_' in one pass
+_UNSAFE_RE = re.compile(r'(?:[^\w\-]|_)+')
+
+# ASCII fast path: unsafe characters mapped to '_' with str.translate
+_SAFE_ASCII = frozenset(string.ascii_letters + string.digits + '-_')
+_ASCII_UNSAFE_TABLE = {code: '_' for code in range(128) if chr(code) not in _SAFE_ASCII}
+_UNDERSCORE_RUNS_RE = re.compile(r'_{2,}')
+
 
 def sanitize_filename(filename):
     """Sanitizes the file name of unsafe characters."""
     name_without_ext = filename.rsplit('.', 1)[0] if '.' in filename else filename
-    sanitized = re.sub(r'[^\w\-]', '_', name_without_ext)
-    sanitized = re.sub(r'_+', '_', sanitized)
+
+    # Common case: already safe, nothing to replace or collapse
+    if name_without_ext.replace('-', '').replace('_', '').isalnum() and '__' not in name_without_ext:
+        return name_without_ext.strip('_') or 'unnamed'
+
+    if name_without_ext.isascii():
+        sanitized = name_without_ext.translate(_ASCII_UNSAFE_TABLE)
+        if '__' in sanitized:
+            sanitized = _UNDERSCORE_RUNS_RE.sub('_', sanitized)
+    else:
+        sanitized = _UNSAFE_RE.sub('_', name_without_ext)
+
     sanitized = sanitized.strip('_')
     return sanitized if sanitized else 'unnamed'
 
 
+def _load_known_files(logs_dir):
+    """
+    Seeds the log file index from logs_dir, oldest first. Called with _known_lock held
+
+    Also creates the directory, so this is the only mkdir per logs directory
+    instead of one per request.
+    """
+    global _known_dir
+
+    logs_dir.mkdir(parents=True, exist_ok=True)
+
+    _known_mtimes.clear()
+    for path in logs_dir.glob('*.txt'):
+        _known_mtimes[path] = path.stat().st_mtime
+
+    _known_heap[:] = [(mtime, path) for path, mtime in _known_mtimes.items()]
+    heapq.heapify(_known_heap)
+    _known_dir = logs_dir
+
+
+def _pop_oldest_known_file():
+    """Removes the oldest live entry from the index and returns its path. Called with _known_lock held"""
+    while _known_heap:
+        mtime, path = heapq.heappop(_known_heap)
+        if _known_mtimes.get(path) == mtime:
+            del _known_mtimes[path]
+            return path
+    return None
+
+
+def _index_written_file(logs_dir, path, max_files, cleanup_enabled, logger):
+    """
+    Adds a written log file to the index, then removes the oldest files beyond max_files
+
+    Eviction runs after the write, under the same lock as the index update,
+    so only files that exist are ever evicted and the file just written is
+    never one of them.
+    """
+    with _known_lock:
+        if _known_dir != logs_dir:
+            _load_known_files(logs_dir)
+
+        # An overwritten file gets a new mtime; its previous heap entry goes stale
+        now = time.time()
+        _known_mtimes[path] = now
+        heapq.heappush(_known_heap, (now, path))
+
+        if not cleanup_enabled:
+            return
+
+        # At least the new file is kept, even with max_files: 0
+        while len(_known_mtimes) > max(max_files, 1):
+            oldest = _pop_oldest_known_file()
+            if oldest is None:
+                break
+            try:
+                oldest.unlink(missing_ok=True)
+                logger.warning(f"Removed: {oldest.name}")
+            except OSError as e:
+                logger.error(f"❌ Failed to remove {oldest.name}: {e}")
+
+
+def _prune_daily_files(logs_dir, keep, logger):
+    """
+    Removes the oldest daily aggregate files so that at most keep remain.
+
+    Args:
+        logs_dir (Path): Logs directory
+        keep (int): Number of daily files to keep
+        logger: Logger object
+    """
+    # Names are YYYY-MM-DD, so name order is date order
+    daily_files = sorted(logs_dir.glob('*.ndjson'))
+    for path in daily_files[:max(len(daily_files) - keep, 0)]:
+        try:
+            path.unlink(missing_ok=True)
+            logger.warning(f"Removed: {path.name}")
+        except OSError as e:
+            logger.error(f"❌ Failed to remove {path.name}: {e}")
+
+
+def _append_daily_record(logs_dir, data, max_files, cleanup_enabled, logger):
+    """
+    Appends one record to the current day's aggregate file.
+
+    Each daily file counts as one file against max_files: when a new day's
+    file is opened, the oldest daily files are removed (cleanup enabled) or
+    the record is refused (cleanup disabled).
+
+    Args:
+        logs_dir (Path): Logs directory
+        data (bytes): Encoded NDJSON line
+        max_files (int): Maximum number of daily files
+        cleanup_enabled (bool): Whether old daily files are removed
+        logger: Logger object
+
+    Returns:
+        Path: The aggregate file, or None if the file limit was reached
+    """
+    global _daily_fd, _daily_key
+
+    today = time.strftime('%Y-%m-%d', time.gmtime())
+    daily_path = logs_dir / f"{today}.ndjson"
+
+    with _daily_lock:
+        if _daily_key != (logs_dir, today):
+            logs_dir.mkdir(parents=True, exist_ok=True)
+
+            if not daily_path.exists():
+                if cleanup_enabled:
+                    # At least the new file is kept, even with max_files: 0
+                    _prune_daily_files(logs_dir, max(max_files, 1) - 1, logger)
+                elif sum(1 for _ in logs_dir.glob('*.ndjson')) >= max_files:
+                    return None
+
+            if _daily_fd is not None:
+                os.close(_daily_fd)
+                _daily_fd = None
+
+            _daily_fd = os.open(daily_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _daily_key = (logs_dir, today)
+
+        os.write(_daily_fd, data)
+
+    return daily_path
+
+
 def create_log_file(metadata, config, logger):
     """Creates a log file with metadata"""
+    global _pending_writes
+
     try:
-        logs_dir = Path(config['storage']['logs_directory'])
-        logs_dir.mkdir(parents=True, exist_ok=True)
+        storage_config = config['storage']
+        logs_dir = Path(storage_config['logs_directory'])
 
-        # Checking file limits
-        existing_files = list(logs_dir.glob('*.txt'))
-        max_files = config['storage'].get('max_files', 1000)
+        # Checking file limits against the in-memory index
+        max_files = storage_config.get('max_files', 1000)
+        cleanup_enabled = storage_config.get('cleanup_enabled', True)
 
-        if len(existing_files) >= max_files:
-            if config['storage'].get('cleanup_enabled', True):
-                oldest = min(existing_files, key=lambda p: p.stat().st_mtime)
-                oldest.unlink()
-                logger.warning(f"Removed: {oldest.name}")
+        if storage_config.get('aggregate_daily', False):
+            # One appended line instead of a file per request; max_files limits the daily files
+            record = {
+                'filename': metadata['filename'],
+                'size': metadata['file_size'],
+                'created_at': metadata['created_at'],
+                'hash': metadata.get('hash', 'N/A'),
+                'processed_at': utc_timestamp()
+            }
+            if orjson is not None:
+                line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
             else:
+                line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+            daily_path = _append_daily_record(logs_dir, line, max_files, cleanup_enabled, logger)
+            if daily_path is None:
                 return False, f"Max files ({max_files}) reached"
 
+            logger.info(f"✅ Appended: {metadata['filename']} -> {daily_path.name}")
+            return True, str(daily_path)
+
         # Formation of a name
         sanitized = sanitize_filename(metadata['filename'])
         timestamp = format_timestamp_for_filename(metadata['created_at'])
         log_filename = f"{sanitized}-{timestamp}.txt"
         log_filepath = logs_dir / log_filename
 
+        with _known_lock:
+            if _known_dir != logs_dir:
+                _load_known_files(logs_dir)
+
+            if (not cleanup_enabled and log_filepath not in _known_mtimes
+                    and len(_known_mtimes) + _pending_writes >= max_files):
+                return False, f"Max files ({max_files}) reached"
+
         # Content
         content = f"""Filename: {metadata['filename']}
 Size: {format_file_size(metadata['file_size'])}
 Created At: {metadata['created_at']}
 Hash: {metadata.get('hash', 'N/A')}
-Processed At: {datetime.now(timezone.utc).isoformat()}
+Processed At: {utc_timestamp()}
 """
 
-        with open(log_filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        async_writes = storage_config.get('async_writes', False)
+        data = content.encode('utf-8')
+
+        if async_writes and get_log_writer().pending() < ASYNC_WRITE_HIGH_WATERMARK:
+            # Written in the background; the request does not wait for the disk.
+            # The writer thread indexes the file once it exists, so eviction
+            # never races a write still in the queue, and a failed write is
+            # never indexed
+            def written(error):
+                global _pending_writes
+                with _known_lock:
+                    _pending_writes -= 1
+                if error is None:
+                    _index_written_file(logs_dir, log_filepath, max_files, cleanup_enabled, logger)
+
+            with _known_lock:
+                _pending_writes += 1
+            get_log_writer().submit(log_filepath, data, on_done=written)
+        else:
+            # Written inline; with async_writes, requests beyond the queue
+            # limit write their own file (backpressure)
+            write_file(log_filepath, data)
+
+            # Indexed only once the file exists: a failed write leaves no entry behind
+            _index_written_file(logs_dir, log_filepath, max_files, cleanup_enabled, logger)
 
         logger.info(f"✅ Created: {log_filename}")
         return True, str(log_filepath)
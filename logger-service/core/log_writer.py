@@ -0,0 +1,119 @@
+"""Background writer for metadata log files"""
+import os
+import atexit
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def write_file(path, data):
+    """
+    Writes bytes to a file with raw os.open/os.write, replacing any existing content.
+
+    Skips the TextIOWrapper/BufferedWriter layers of open(), which only
+    add copies for a single small write.
+
+    Args:
+        path (str|Path): Target file
+        data (bytes): File content
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+class _WriteRequest:
+    """A pending background file write"""
+
+    __slots__ = ('path', 'data', 'on_done')
+
+    def __init__(self, path, data, on_done=None):
+        self.path = path
+        self.data = data
+        self.on_done = on_done
+
+
+class LogFileWriter:
+    """
+    Writes log files on a dedicated thread.
+
+    Requests from concurrent HTTP workers are queued and left to complete
+    in the background; the writer thread drains up to max_batch of them
+    per wake-up.
+    """
+
+    def __init__(self, max_batch=64):
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='log-file-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, path, data, on_done=None):
+        """
+        Queues a write without waiting for it. Failures are logged by the writer thread.
+
+        Args:
+            path (str|Path): Target file
+            data (bytes): File content
+            on_done (callable): Optional; called on the writer thread once the
+                write has finished, with the exception it raised or None
+        """
+        self._queue.put(_WriteRequest(path, data, on_done))
+
+    def pending(self):
+        """Number of queued writes (approximate)"""
+        return self._queue.qsize()
+
+    def flush(self):
+        """Blocks until every queued write has completed"""
+        self._queue.join()
+
+    def _run(self):
+        """Writer thread loop"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for request in batch:
+                error = None
+                try:
+                    write_file(request.path, request.data)
+                except Exception as e:
+                    # Any failure is reported, never allowed to stop the writer thread
+                    error = e
+                    logger.error(f"❌ Failed to write {request.path}: {e}")
+                finally:
+                    if request.on_done is not None:
+                        try:
+                            request.on_done(error)
+                        except Exception as e:
+                            logger.error(f"❌ Write callback failed for {request.path}: {e}")
+                    self._queue.task_done()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer():
+    """Returns the shared LogFileWriter, starting it on first use"""
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = LogFileWriter()
+                # Background writes still pending at shutdown are completed first
+                atexit.register(_writer.flush)
+
+    return _writer
@@ -31,8 +31,22 @@ if __name__ == '__main__':
     logger.info("=" * 60)
 
     # Let's start the server
-    app.run(
-        host=config['service']['host'],
-        port=config['service']['port'],
-        debug=config['service'].get('debug', False)
-    )
\ No newline at end of file
+    if config['service'].get('debug', False):
+        # Flask's development server with the reloader and debugger
+        app.run(
+            host=config['service']['host'],
+            port=config['service']['port'],
+            debug=True
+        )
+    else:
+        # Production WSGI server with a pool of worker threads
+        from waitress import serve
+
+        threads = config['service'].get('threads', 8)
+        logger.info(f"🧵 Serving with waitress ({threads} threads)")
+        serve(
+            app,
+            host=config['service']['host'],
+            port=config['service']['port'],
+            threads=threads
+        )
\ No newline at end of file
@@ -1,11 +1,17 @@
 """Services module"""
 from .jwt_service import validate_jwt_token, extract_token_from_header
-from .notification_service import send_email_notification, send_syslog_notification, SyslogLevel
+from .notification_service import (
+    send_email_notification,
+    send_syslog_notification,
+    send_notification_async,
+    SyslogLevel
+)
 
 __all__ = [
     'validate_jwt_token',
     'extract_token_from_header',
     'send_email_notification',
     'send_syslog_notification',
+    'send_notification_async',
     'SyslogLevel'
 ]
\ No newline at end of file
@@ -1,28 +1,90 @@
 """JWT authentication"""
+import time
 import logging
+import threading
+from collections import OrderedDict
 import jwt
 
 logger = logging.getLogger(__name__)
 
+# Decoder reused across requests instead of the module-level jwt.decode wrapper
+_jwt_decoder = jwt.PyJWT()
+
+# Validation results: {(token, secret, algorithm, issuer): (expires_at, (is_valid, result))}
+TOKEN_CACHE_SIZE = 4096
+# Rejected tokens are remembered briefly, so a replayed bad token skips the HMAC check too
+REJECTED_TOKEN_TTL = 60
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _get_cached_result(key):
+    """Returns the cached (is_valid, result) for a token, or None if unknown or stale"""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+
+        if entry[0] <= time.time():
+            del _token_cache[key]
+            return None
+
+        _token_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_result(key, expires_at, result):
+    """Remembers a validation result until expires_at"""
+    with _token_cache_lock:
+        _token_cache[key] = (expires_at, result)
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+
+def _reject(key, error):
+    """Caches and returns a failed validation result"""
+    result = (False, error)
+    _cache_result(key, time.time() + REJECTED_TOKEN_TTL, result)
+    return result
+
+
 def validate_jwt_token(token, config):
     """Validates JWT token"""
+    jwt_config = config['jwt']
+    # The key includes the settings, so a config change invalidates cached tokens
+    cache_key = (token, jwt_config['secret'], jwt_config['algorithm'], jwt_config['expected_issuer'])
+
+    cached = _get_cached_result(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        payload = jwt.decode(
+        payload = _jwt_decoder.decode(
             token,
-            config['jwt']['secret'],
-            algorithms=[config['jwt']['algorithm']]
+            jwt_config['secret'],
+            algorithms=[jwt_config['algorithm']],
+            issuer=jwt_config['expected_issuer'],
+            options={'require': ['iss']}
         )
-        if payload.get('iss') != config['jwt']['expected_issuer']:
-            return False, f"Invalid issuer"
+
+        # Valid tokens are remembered until their exp claim
+        exp = payload.get('exp')
+        if isinstance(exp, (int, float)):
+            _cache_result(cache_key, exp, (True, payload))
         return True, payload
 
+    # These failures do not change over time for the same token and settings
     except jwt.ExpiredSignatureError:
-        return False, "Token has expired"
+        return _reject(cache_key, "Token has expired")
+    except (jwt.InvalidIssuerError, jwt.MissingRequiredClaimError):
+        return _reject(cache_key, "Invalid issuer")
     except jwt.InvalidSignatureError:
-        return False, "Invalid token signature"
+        return _reject(cache_key, "Invalid token signature")
     except jwt.DecodeError:
-        return False, "Token decode error"
+        return _reject(cache_key, "Token decode error")
     except Exception as e:
+        # Not cached: e.g. a token that is not valid yet (nbf) may become valid
         return False, f"Token validation error: {str(e)}"
 
 
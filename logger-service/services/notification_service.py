@@ -1,16 +1,62 @@
 """Notification service (Email and Syslog)"""
 import os
+import atexit
 import smtplib
+import queue
 import socket
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 
 logger = logging.getLogger(__name__)
 
+# Background threads for notifications, so SMTP/syslog IO never delays an HTTP response
+_notification_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notifier')
+
+# Emails are queued and sent by one background thread, batching what arrives together
+EMAIL_QUEUE_SIZE = 256
+EMAIL_BATCH_SIZE = 20
+EMAIL_BATCH_WAIT = 0.5  # seconds to wait for more emails before sending a batch
+
+# Seconds to wait at exit for queued emails to be sent
+EMAIL_DRAIN_TIMEOUT = 30
+
+_email_queue = queue.Queue(maxsize=EMAIL_QUEUE_SIZE)
+_email_thread = None
+_email_thread_lock = threading.Lock()
+
+# Queued by _drain_email_queue at exit: the sender sends its current batch and stops
+_EMAIL_STOP = object()
+
+# UDP is connectionless, so one socket serves every syslog message (sendto is thread-safe)
+_syslog_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+# Message prefixes by severity: priority = facility * 8 + severity, facility 16 = local use 0
+_SYSLOG_PREFIXES = {level: f"<{16 * 8 + level}>logger-service: " for level in range(8)}
+
+
+def send_notification_async(send_func, *args):
+    """
+    Runs a notification function in the background.
+
+    Args:
+        send_func: Notification function, e.g. send_syslog_notification
+        *args: Arguments for send_func
+
+    Returns:
+        concurrent.futures.Future
+    """
+    return _notification_executor.submit(send_func, *args)
+
 
 def send_email_notification(config, subject, message, app_logger=None):
     """
-    Sends an email notification.
+    Queues an email notification for the background email sender.
+
+    Returns immediately; the email is sent on the sender thread, which
+    reuses one SMTP connection for every message queued at the same time.
+    If the queue is full the email is dropped and a warning is logged.
 
     Args:
         config: Application configuration
@@ -20,18 +66,84 @@ def send_email_notification(config, subject, message, app_logger=None):
     """
     log = app_logger or logger
 
-    if not config['notifications']['email']['enabled']:
+    email_config = config['notifications']['email']
+    if not email_config['enabled']:
         log.debug("Email notifications disabled")
         return
 
+    _start_email_sender()
+
+    try:
+        _email_queue.put_nowait((dict(email_config), subject, message, log))
+    except queue.Full:
+        log.warning(f"⚠️ Email queue full, dropping email: {subject}")
+
+
+def _start_email_sender():
+    """Starts the email sender thread on first use"""
+    global _email_thread
+
+    if _email_thread is None:
+        with _email_thread_lock:
+            if _email_thread is None:
+                _email_thread = threading.Thread(target=_email_sender_loop, name='email-sender', daemon=True)
+                _email_thread.start()
+                atexit.register(_drain_email_queue)
+
+
+def _drain_email_queue():
+    """Sends the emails still queued at exit, waiting up to EMAIL_DRAIN_TIMEOUT seconds"""
     try:
-        email_config = config['notifications']['email']
+        _email_queue.put(_EMAIL_STOP, timeout=EMAIL_DRAIN_TIMEOUT)
+    except queue.Full:
+        logger.warning("⚠️ Email queue still full at exit, remaining emails are dropped")
+        return
 
-        msg = MIMEText(message)
-        msg['Subject'] = f"[Logger Service] {subject}"
-        msg['From'] = email_config['from']
-        msg['To'] = email_config['to']
+    _email_thread.join(EMAIL_DRAIN_TIMEOUT)
+    if _email_thread.is_alive():
+        logger.warning("⚠️ Timed out sending queued emails at exit")
+
+
+def _email_sender_loop():
+    """Collects queued emails into batches and sends each batch over one SMTP connection"""
+    stopping = False
+    while not stopping:
+        item = _email_queue.get()
+        if item is _EMAIL_STOP:
+            return
+
+        batch = [item]
+        while len(batch) < EMAIL_BATCH_SIZE:
+            try:
+                item = _email_queue.get(timeout=EMAIL_BATCH_WAIT)
+            except queue.Empty:
+                break
+            if item is _EMAIL_STOP:
+                # Send what was collected, then stop
+                stopping = True
+                break
+            batch.append(item)
+
+        # Emails queued before and after a config change go to different servers
+        groups = {}
+        for item in batch:
+            email_config = item[0]
+            key = tuple(sorted((k, str(v)) for k, v in email_config.items()))
+            groups.setdefault(key, []).append(item)
+
+        for items in groups.values():
+            _send_emails(items[0][0], items)
+
+
+def _send_emails(email_config, items):
+    """
+    Sends queued emails over a single SMTP connection.
 
+    Args:
+        email_config: notifications.email section of the configuration
+        items: List of (email_config, subject, message, log) tuples
+    """
+    try:
         with smtplib.SMTP(email_config['smtp_host'], email_config['smtp_port']) as server:
             if email_config.get('use_tls', True):
                 server.starttls()
@@ -40,12 +152,18 @@ def send_email_notification(config, subject, message, app_logger=None):
             if password:
                 server.login(email_config['from'], password)
 
-            server.send_message(msg)
+            for _, subject, message, log in items:
+                msg = MIMEText(message)
+                msg['Subject'] = f"[Logger Service] {subject}"
+                msg['From'] = email_config['from']
+                msg['To'] = email_config['to']
 
-        log.debug(f"📧 Email sent: {subject}")
+                server.send_message(msg)
+                log.debug(f"📧 Email sent: {subject}")
 
     except Exception as e:
-        log.error(f"❌ Failed to send email: {e}")
+        for _, subject, _, log in items:
+            log.error(f"❌ Failed to send email '{subject}': {e}")
 
 
 def send_syslog_notification(config, level, message, app_logger=None):
@@ -61,27 +179,22 @@ def send_syslog_notification(config, level, message, app_logger=None):
     """
     log = app_logger or logger
 
-    if not config['notifications']['syslog']['enabled']:
+    syslog_config = config['notifications']['syslog']
+    if not syslog_config['enabled']:
         log.debug("Syslog notifications disabled")
         return
 
     try:
-        syslog_config = config['notifications']['syslog']
-
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
         # Формат syslog: <priority>timestamp hostname tag: message
-        # priority = facility * 8 + severity
-        # facility 16 = local use 0
-        priority = 16 * 8 + level
-        syslog_msg = f"<{priority}>logger-service: {message}"
+        prefix = _SYSLOG_PREFIXES.get(level) or f"<{16 * 8 + level}>logger-service: "
+        syslog_msg = prefix + message
 
-        sock.sendto(
+        _syslog_sock.sendto(
             syslog_msg.encode('utf-8'),
             (syslog_config['host'], syslog_config['port'])
         )
 
-        sock.close()
         log.debug(f"📡 Syslog sent: {message[:50]}...")
 
     except Exception as e:
@@ -1,4 +1,5 @@
 """Utils module"""
-from .formatters import format_file_size, format_timestamp_for_filename
+from .formatters import format_file_size, format_timestamp_for_filename, utc_timestamp
+from .log_reader import read_last_lines
 
-__all__ = ['format_file_size', 'format_timestamp_for_filename']
\ No newline at end of file
+__all__ = ['format_file_size', 'format_timestamp_for_filename', 'utc_timestamp', 'read_last_lines']
\ No newline at end of file
@@ -1,20 +1,24 @@
 """Data formatting utilities"""
+import time
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+
+@lru_cache(maxsize=4096)
 def format_file_size(size_bytes):
     """Formats the file size into a human-readable format."""
     if size_bytes < 1024:
         return f"{size_bytes}B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f}KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f}MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f}GB"
+
+    # Each unit is 10 bits wider than the previous one; GB is the largest unit
+    unit = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.2f}{SIZE_UNITS[unit]}"
 
 
 def format_timestamp_for_filename(iso_timestamp):
@@ -25,23 +29,45 @@ def format_timestamp_for_filename(iso_timestamp):
         2025-09-30T14:33:22Z -> 20250930T143322Z
         2025-09-30T14:33:22+00:00 -> 20250930T143322Z
     """
-    # logger.debug("This is DEBUG")
-    # logger.info("This is INFO")
-
-
     try:
-        # Parsing different formats
-        if iso_timestamp.endswith('Z'):
-            dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
-        elif '+' in iso_timestamp or iso_timestamp.count('-') > 2:
-            dt = datetime.fromisoformat(iso_timestamp)
-        else:
-            # If the format is unclear, use the current time
-            dt = datetime.now(timezone.utc)
+        formatted = _format_iso_timestamp(iso_timestamp)
+        if formatted is not None:
+            return formatted
 
-        return dt.strftime('%Y%m%dT%H%M%SZ')
+        # If the format is unclear, use the current time
+        return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
 
     except Exception as e:
         # If parsing fails, use the current time.
         logger.warning(f"Failed to parse timestamp '{iso_timestamp}': {e}. Using current time.")
-        return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
\ No newline at end of file
+        return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+@lru_cache(maxsize=1024)
+def _format_iso_timestamp(iso_timestamp):
+    """
+    Parses an ISO 8601 timestamp into filename format.
+
+    Files uploaded together often share created_at, so results are cached.
+    Returns None when the string is not in a recognized format; that case
+    and parse errors depend on the current time and are never cached.
+    """
+    # Parsing different formats
+    if iso_timestamp.endswith('Z'):
+        dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
+    elif '+' in iso_timestamp or iso_timestamp.count('-') > 2:
+        dt = datetime.fromisoformat(iso_timestamp)
+    else:
+        return None
+
+    return dt.strftime('%Y%m%dT%H%M%SZ')
+
+
+def utc_timestamp():
+    """
+    Current UTC time as an ISO 8601 string with second precision
+
+    Example:
+        2025-09-30T14:33:22Z
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
@@ -0,0 +1,40 @@
+"""Reading service log files"""
+import os
+
+
+def read_last_lines(filepath, max_lines, block_size=64 * 1024):
+    """
+    Returns the last max_lines lines of a text file without reading all of it.
+
+    Reads a block from the end of the file and doubles it until it holds
+    enough lines or reaches the start of the file.
+
+    Args:
+        filepath (str|Path): Path to the file
+        max_lines (int): Number of lines to return
+        block_size (int): Initial number of bytes to read from the end
+
+    Returns:
+        list: Lines without line terminators
+    """
+    if max_lines <= 0:
+        return []
+
+    with open(filepath, 'rb') as f:
+        file_size = f.seek(0, os.SEEK_END)
+        read_size = min(file_size, block_size)
+
+        while True:
+            f.seek(file_size - read_size)
+            data = f.read(read_size)
+            if read_size == file_size or data.count(b'\n') > max_lines:
+                break
+            read_size = min(file_size, read_size * 2)
+
+    lines = data.decode('utf-8', errors='replace').splitlines()
+
+    # The first line is cut off unless we read from the start of the file
+    if read_size < file_size:
+        lines = lines[1:]
+
+    return lines[-max_lines:]
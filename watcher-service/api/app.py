@@ -10,6 +10,7 @@ from .routes.config_routes import config_bp
 from .routes.stats_routes import stats_bp
 from .routes.files_routes import files_bp
 from .routes.logs_routes import logs_bp
+from .json_provider import OrjsonProvider
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,11 @@ def create_app(config, app_logger, stats_obj):
         static_folder=str(static_dir)
     )
     # app = Flask(__name__)
-    app.config['JSON_AS_ASCII'] = False
+    # orjson writes UTF-8 directly, so no JSON_AS_ASCII setting is needed
+    app.json = OrjsonProvider(app)
+
+    # Behind nginx/Apache, file downloads can be handed to the web server (X-Sendfile)
+    app.use_x_sendfile = config['service'].get('use_x_sendfile', False)
 
     # Saving configuration in the application context
     app.config['WATCHER_CONFIG'] = config
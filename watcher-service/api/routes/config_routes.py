@@ -1,10 +1,10 @@
 """
 API endpoints for managing configuration
 """
-import copy
 import logging
 from flask import Blueprint, request, jsonify, current_app
 from core.config import save_config
+from api.utils import sanitize_config_for_display
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +22,8 @@ def get_config():
     try:
         config = current_app.config['WATCHER_CONFIG']
 
-        # Hide sensitive data (deep copy to avoid modifying original)
-        safe_config = copy.deepcopy(config)
-        if 'jwt' in safe_config and 'secret' in safe_config['jwt']:
-            safe_config['jwt']['secret'] = '***hidden***'
-        if 'notifications' in safe_config and 'email' in safe_config['notifications']:
-            if 'password' in safe_config['notifications']['email']:
-                safe_config['notifications']['email']['password'] = '***hidden***'
+        # Hide sensitive data (copies only the masked sections)
+        safe_config = sanitize_config_for_display(config)
 
         return jsonify(safe_config), 200
 
@@ -2,56 +2,149 @@
 API endpoints for working with files
 """
 
+import os
+import time
 import logging
-from pathlib import Path
-from datetime import datetime, timezone
 from flask import Blueprint, jsonify, current_app
-from api.utils import format_file_size
+from api.utils import format_file_size, format_mtime
+from core.stats import IGNORED_FILES
 
 logger = logging.getLogger(__name__)
 
 files_bp = Blueprint('files', __name__)
 
+# Listings are reused while the directory mtime is unchanged, for at most
+# LISTING_TTL seconds (a file growing in place does not touch the directory mtime)
+LISTING_TTL = 2
+_listing_cache = {}
 
-@files_bp.route('/files/pending', methods=['GET'])
-def get_pending_files():
+
+def _cached_listing(key, directory, build):
     """
-    Get a list of files in the queue
+    Returns build() for a directory, reusing the previous result while it is fresh
+
+    Args:
+        key: Cache key, unique per endpoint and directory
+        directory (str): Directory the result is derived from
+        build: Function computing the result
 
     Returns:
-        JSON: List of files pending processing
+        The cached or newly built result
     """
     try:
-        config = current_app.config['WATCHER_CONFIG']
-        watched_dir = Path(config['watcher']['watch_directory'])
+        dir_mtime = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        dir_mtime = None
+
+    now = time.monotonic()
+    cached = _listing_cache.get(key)
+    if cached and cached[0] == dir_mtime and now < cached[1]:
+        return cached[2]
+
+    result = build()
+    _listing_cache[key] = (dir_mtime, now + LISTING_TTL, result)
+    return result
 
-        if not watched_dir.exists():
-            return jsonify([]), 200
 
-        ignored_patterns = {'.gitkeep', '.gitignore', '.DS_Store', 'Thumbs.db'}
+def _json_body(data):
+    """Serializes data exactly as jsonify does, for caching"""
+    return jsonify(data).get_data()
 
-        files = []
-        for file_path in watched_dir.glob('*'):
-            if file_path.is_file():
-                # Pass files from ignored list
-                if file_path.name in ignored_patterns:
+
+def _json_response(body):
+    """Wraps a cached JSON body in a response"""
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def _scan_files(directory, ignored=frozenset()):
+    """
+    Lists regular files in a directory with os.scandir.
+
+    The file type comes from the directory entry, so only one stat call
+    is made per file. A missing directory yields nothing.
+
+    Yields:
+        tuple: (name, os.stat_result)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in ignored:
                     continue
+                if entry.is_file():
+                    yield entry.name, entry.stat()
+    except FileNotFoundError:
+        return
 
-                stat = file_path.stat()
-                files.append({
-                    'name': file_path.name,
-                    'size': format_file_size(stat.st_size),
-                    'size_bytes': stat.st_size,
-                    'created': datetime.fromtimestamp(
-                        stat.st_mtime,
-                        tz=timezone.utc
-                    ).strftime('%Y-%m-%d %H:%M:%S')
-                })
 
-        # Sort by creation date
-        files.sort(key=lambda x: x['created'], reverse=True)
+def _count_entries(directory, ignored=frozenset(), files_only=False):
+    """Counts directory entries without stat calls; 0 if the directory is missing"""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(
+                1 for entry in entries
+                if entry.name not in ignored
+                and (not files_only or entry.is_file())
+            )
+    except FileNotFoundError:
+        return 0
+
+
+def _entry_mtime(entry):
+    """Sort key for (name, stat) pairs from _scan_files"""
+    return entry[1].st_mtime
+
+
+def _list_pending(watched_dir):
+    """Builds the /files/pending listing, newest first"""
+    # Sort by creation date, on the raw mtime rather than the formatted string
+    entries = sorted(_scan_files(watched_dir, IGNORED_FILES), key=_entry_mtime, reverse=True)
+
+    return [
+        {
+            'name': name,
+            'size': format_file_size(stat.st_size),
+            'size_bytes': stat.st_size,
+            'created': format_mtime(stat.st_mtime)
+        }
+        for name, stat in entries
+    ]
+
+
+def _list_processed(processed_dir):
+    """Builds the /files/processed listing, newest first"""
+    # Sort by processing date
+    entries = sorted(_scan_files(processed_dir), key=_entry_mtime, reverse=True)
+
+    return [
+        {
+            'name': name,
+            'size': format_file_size(stat.st_size),
+            'size_bytes': stat.st_size,
+            'processed': format_mtime(stat.st_mtime)
+        }
+        for name, stat in entries
+    ]
+
+
+@files_bp.route('/files/pending', methods=['GET'])
+def get_pending_files():
+    """
+    Get a list of files in the queue
+
+    Returns:
+        JSON: List of files pending processing
+    """
+    try:
+        config = current_app.config['WATCHER_CONFIG']
+        watched_dir = config['watcher']['watch_directory']
 
-        return jsonify(files), 200
+        body = _cached_listing(
+            ('pending', watched_dir),
+            watched_dir,
+            lambda: _json_body(_list_pending(watched_dir))
+        )
+        return _json_response(body), 200
 
     except Exception as e:
         logger.error(f"Failed to get pending files: {e}")
@@ -68,29 +161,14 @@ def get_processed_files():
     """
     try:
         config = current_app.config['WATCHER_CONFIG']
-        processed_dir = Path(config['watcher']['processed_directory'])
-
-        if not processed_dir.exists():
-            return jsonify([]), 200
-
-        files = []
-        for file_path in processed_dir.glob('*'):
-            if file_path.is_file():
-                stat = file_path.stat()
-                files.append({
-                    'name': file_path.name,
-                    'size': format_file_size(stat.st_size),
-                    'size_bytes': stat.st_size,
-                    'processed': datetime.fromtimestamp(
-                        stat.st_mtime,
-                        tz=timezone.utc
-                    ).strftime('%Y-%m-%d %H:%M:%S')
-                })
-
-        # Sort by processing date
-        files.sort(key=lambda x: x['processed'], reverse=True)
-
-        return jsonify(files), 200
+        processed_dir = config['watcher']['processed_directory']
+
+        body = _cached_listing(
+            ('processed', processed_dir),
+            processed_dir,
+            lambda: _json_body(_list_processed(processed_dir))
+        )
+        return _json_response(body), 200
 
     except Exception as e:
         logger.error(f"Failed to get processed files: {e}")
@@ -107,16 +185,19 @@ def get_files_count():
     """
     try:
         config = current_app.config['WATCHER_CONFIG']
-        watched_dir = Path(config['watcher']['watch_directory'])
-        processed_dir = Path(config['watcher']['processed_directory'])
-        ignored_patterns = {'.gitkeep', '.gitignore', '.DS_Store', 'Thumbs.db'}
-
-        pending_count = sum(
-            1 for f in watched_dir.glob('*')
-            if f.is_file() and f.name not in ignored_patterns
-        ) if watched_dir.exists() else 0
-
-        processed_count = len(list(processed_dir.glob('*'))) if processed_dir.exists() else 0
+        watched_dir = config['watcher']['watch_directory']
+        processed_dir = config['watcher']['processed_directory']
+
+        pending_count = _cached_listing(
+            ('pending_count', watched_dir),
+            watched_dir,
+            lambda: _count_entries(watched_dir, IGNORED_FILES, files_only=True)
+        )
+        processed_count = _cached_listing(
+            ('processed_count', processed_dir),
+            processed_dir,
+            lambda: _count_entries(processed_dir)
+        )
 
         return jsonify({
             'pending': pending_count,
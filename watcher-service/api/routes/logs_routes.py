@@ -2,14 +2,92 @@
 API endpoints for working with logs
 """
 
+import os
+import re
+import mmap
 import logging
+from collections import deque
 from pathlib import Path
 from flask import Blueprint, jsonify, request, current_app
+from api.utils import parse_log_line, read_last_lines
 
 logger = logging.getLogger(__name__)
 
 logs_bp = Blueprint('logs', __name__)
 
+# Search results returned by /logs/search (the most recent matches)
+MAX_SEARCH_RESULTS = 100
+
+# Last /logs/recent response: (path, lines, st_mtime_ns, st_size, JSON body).
+# Refreshes while the log has not been written to are answered from it
+_recent_cache = None
+
+
+def _search_log_file(log_file, search_query, level_filter):
+    """
+    Searches the log file through mmap, decoding only candidate lines
+
+    The file is scanned for the query (ASCII, case-insensitive) or, with
+    only a level filter, for the level name. Lines without a hit are
+    never decoded or split.
+
+    Returns:
+        deque: Up to MAX_SEARCH_RESULTS most recent matching entries
+    """
+    logs = deque(maxlen=MAX_SEARCH_RESULTS)
+
+    if search_query:
+        pattern = re.compile(re.escape(search_query.encode('ascii')), re.IGNORECASE)
+    elif level_filter:
+        pattern = re.compile(re.escape(level_filter.encode('utf-8')))
+    else:
+        pattern = re.compile(rb'[^\n]')
+
+    with open(log_file, 'rb') as f:
+        # mmap cannot map an empty file
+        if f.seek(0, os.SEEK_END) == 0:
+            return logs
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            position = 0
+
+            while position < size:
+                match = pattern.search(mm, position)
+                if match is None:
+                    break
+
+                line_start = mm.rfind(b'\n', 0, match.start()) + 1
+                line_end = mm.find(b'\n', match.start())
+                if line_end == -1:
+                    line_end = size
+
+                # Continue after this line so it is reported once
+                position = line_end + 1
+
+                line = mm[line_start:line_end].decode('utf-8', errors='replace')
+                entry = parse_log_line(line, level_filter)
+                if entry:
+                    logs.append(entry)
+
+    return logs
+
+
+def _search_log_lines(log_file, search_query, level_filter):
+    """Line-by-line search, for queries whose case folding is not ASCII-only"""
+    logs = deque(maxlen=MAX_SEARCH_RESULTS)
+
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if search_query not in line.lower():
+                continue
+
+            entry = parse_log_line(line, level_filter)
+            if entry:
+                logs.append(entry)
+
+    return logs
+
 
 @logs_bp.route('/logs/recent', methods=['GET'])
 def get_recent_logs():
@@ -22,6 +100,8 @@ def get_recent_logs():
     Returns:
         JSON: Array of logs
     """
+    global _recent_cache
+
     try:
         config = current_app.config['WATCHER_CONFIG']
         log_file = Path(config['logging']['file'])
@@ -29,23 +109,23 @@ def get_recent_logs():
         # We get the number of lines parameter
         lines_count = request.args.get('lines', default=50, type=int)
 
-        if not log_file.exists():
+        try:
+            st = os.stat(log_file)
+        except FileNotFoundError:
             return jsonify([]), 200
 
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[-lines_count:]
+        cached = _recent_cache
+        if cached and cached[:4] == (log_file, lines_count, st.st_mtime_ns, st.st_size):
+            return current_app.response_class(cached[4], mimetype='application/json'), 200
+
+        # Only the end of the file is read, however large the log has grown
+        lines = read_last_lines(log_file, lines_count)
 
-        logs = []
-        for line in lines:
-            parts = line.split(' - ')
-            if len(parts) >= 3:
-                logs.append({
-                    'timestamp': parts[0],
-                    'level': parts[2].strip(),
-                    'message': ' - '.join(parts[3:]).strip()
-                })
+        logs = [entry for entry in map(parse_log_line, lines) if entry]
 
-        return jsonify(logs), 200
+        response = jsonify(logs)
+        _recent_cache = (log_file, lines_count, st.st_mtime_ns, st.st_size, response.get_data())
+        return response, 200
 
     except Exception as e:
         logger.error(f"Failed to get recent logs: {e}")
@@ -74,29 +154,13 @@ def search_logs():
         if not log_file.exists():
             return jsonify([]), 200
 
-        logs = []
-        with open(log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.split(' - ')
-                if len(parts) >= 3:
-                    level = parts[2].strip()
-                    message = ' - '.join(parts[3:]).strip()
-
-                    # Applying filters
-                    if level_filter and level != level_filter:
-                        continue
-
-                    if search_query and search_query not in line.lower():
-                        continue
-
-                    logs.append({
-                        'timestamp': parts[0],
-                        'level': level,
-                        'message': message
-                    })
+        if search_query.isascii():
+            logs = _search_log_file(log_file, search_query, level_filter)
+        else:
+            logs = _search_log_lines(log_file, search_query, level_filter)
 
         # Returning the last 100 results
-        return jsonify(logs[-100:]), 200
+        return jsonify(list(logs)), 200
 
     except Exception as e:
         logger.error(f"Failed to search logs: {e}")
@@ -118,12 +182,18 @@ def download_logs():
         if not log_file.exists():
             return jsonify({'error': 'Log file not found'}), 404
 
+        # Conditional responses: unchanged files are answered with 304 and
+        # Range requests are honoured, so the log is not re-sent in full.
+        # Relative paths are resolved against the working directory (where
+        # the service writes the log), not the application root.
         from flask import send_file
         return send_file(
-            log_file,
+            log_file.resolve(),
             as_attachment=True,
             download_name='watcher_service.log',
-            mimetype='text/plain'
+            mimetype='text/plain',
+            conditional=True,
+            etag=True
         )
 
     except Exception as e:
@@ -5,6 +5,7 @@ API endpoints for statistics
 import logging
 import requests
 from flask import Blueprint, jsonify, current_app
+from integration.logger_client import get_http_session, get_logger_health_url
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +41,7 @@ def reset_stats():
     """
     try:
         stats = current_app.config['WATCHER_STATS']
-
-        stats.total_processed = 0
-        stats.today_processed = 0
-        stats.failed = 0
+        stats.reset()
 
         logger.info("Statistics reset")
         return jsonify({
@@ -67,10 +65,9 @@ def test_connection():
 
     try:
         config = current_app.config['WATCHER_CONFIG']
-        # logger_url = config['logger_service']['url'].replace('/log', '/health')
-        logger_url = config['logger_service']['url'].rsplit('/log', 1)[0] + '/health'
+        logger_url = get_logger_health_url(config)
 
-        response = requests.get(logger_url, timeout=5)
+        response = get_http_session().get(logger_url, timeout=5)
 
         if response.status_code == 200:
             return jsonify({
@@ -2,7 +2,15 @@
 Helper functions for the API
 """
 
+import os
+import time
+from functools import lru_cache
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+
+# Directory listings repeat the same sizes; results are memoized
+@lru_cache(maxsize=4096)
 def format_file_size(size_bytes):
     """
     Formats file size for display
@@ -15,37 +23,105 @@ def format_file_size(size_bytes):
     """
     if size_bytes < 1024:
         return f"{size_bytes}B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.2f}KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.2f}MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f}GB"
+
+    # Each unit is 10 bits wider than the previous one; GB is the largest unit
+    unit = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.2f}{SIZE_UNITS[unit]}"
 
 
-def parse_log_line(line):
+def format_mtime(mtime):
     """
-    Parses a log line
+    Formats a file modification time as a UTC 'YYYY-MM-DD HH:MM:SS' string
 
     Args:
-        line (str): A line from the log file
+        mtime (float): Timestamp, e.g. os.stat_result.st_mtime
 
     Returns:
-        dict: Parsed log entry or None
+        str: Formatted time
+    """
+    return _format_epoch_second(int(mtime))
+
+
+# Files written together share the same second, so listings hit this cache often
+@lru_cache(maxsize=1024)
+def _format_epoch_second(seconds):
+    """Formats whole epoch seconds in UTC"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(seconds))
+
+
+def parse_log_line(line, level_filter=''):
     """
-    parts = line.split(' - ')
+    Parses a log line into an API entry
 
+    A str.split with maxsplit is used rather than a regex: it is the faster
+    of the two for this format and keeps any ' - ' inside the message.
+
+    Args:
+        line (str): A line from the log file
+        level_filter (str): Only entries of this level are returned (optional)
+
+    Returns:
+        dict: Parsed log entry, or None if the line is malformed or filtered out
+    """
+    # At most 4 parts: the message keeps any ' - ' of its own
+    parts = line.split(' - ', 3)
     if len(parts) < 3:
         return None
 
+    level = parts[2].strip()
+    if level_filter and level != level_filter:
+        return None
+
     return {
         'timestamp': parts[0],
-        'logger': parts[1],
-        'level': parts[2].strip(),
-        'message': ' - '.join(parts[3:]).strip()
+        'level': level,
+        'message': parts[3].strip() if len(parts) == 4 else ''
     }
 
 
+def read_last_lines(filepath, max_lines, block_size=8192):
+    """
+    Reads the last lines of a text file without reading the whole file
+
+    Walks backwards from the end in block_size chunks until enough
+    newlines have been seen or the start of the file is reached.
+
+    Args:
+        filepath (str|Path): Path to the file
+        max_lines (int): Number of lines to return
+        block_size (int): Bytes read per step
+
+    Returns:
+        list: Lines without line terminators
+    """
+    if max_lines <= 0:
+        return []
+
+    chunks = []
+    newlines = 0
+
+    with open(filepath, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+
+        # One extra newline marks the start of the oldest wanted line
+        while position > 0 and newlines <= max_lines:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+
+    data = b''.join(reversed(chunks))
+    lines = data.decode('utf-8', errors='replace').splitlines()
+
+    # The first line is cut off unless we read from the start of the file
+    if position > 0:
+        lines = lines[1:]
+
+    return lines[-max_lines:]
+
+
 def validate_config_section(section, data):
     """
     Validates data for configuration update
@@ -82,23 +158,28 @@ def sanitize_config_for_display(config):
     """
     Removes sensitive data from configuration for display
 
+    Only the dicts on the path to a masked value are copied; every other
+    section is shared with the live configuration, so the result must be
+    treated as read-only.
+
     Args:
         config (dict): Configuration
 
     Returns:
         dict: Safe copy of the configuration
     """
-    import copy
-    safe_config = copy.deepcopy(config)
+    safe_config = dict(config)
 
     # Hide JWT secret
     if 'jwt' in safe_config and 'secret' in safe_config['jwt']:
-        safe_config['jwt']['secret'] = '***hidden***'
+        safe_config['jwt'] = {**safe_config['jwt'], 'secret': '***hidden***'}
 
     # Hide email password
     if 'notifications' in safe_config:
         if 'email' in safe_config['notifications']:
             if 'password' in safe_config['notifications']['email']:
-                safe_config['notifications']['email']['password'] = '***hidden***'
+                notifications = dict(safe_config['notifications'])
+                notifications['email'] = {**notifications['email'], 'password': '***hidden***'}
+                safe_config['notifications'] = notifications
 
     return safe_config
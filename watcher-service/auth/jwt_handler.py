@@ -4,41 +4,64 @@ JWT Authentication
 
 import jwt
 import logging
+import threading
 import time
-from datetime import datetime, timedelta, timezone
 
-_cached_token = None
-_token_expiry = 0
+# (token, expiry, settings) of the cached token, replaced as a whole so that
+# readers can check it without taking _token_lock
+_token_entry = None
+_token_lock = threading.Lock()
+
+# A cached token is replaced this many seconds before it expires,
+# so it cannot expire while a request is in flight
+TOKEN_REFRESH_MARGIN = 30
 
 logger = logging.getLogger(__name__)
 
 
+def _usable_token(entry, settings):
+    """Returns the token of a cache entry if it was made with settings and is not about to expire"""
+    if entry and entry[2] == settings and time.time() < entry[1] - TOKEN_REFRESH_MARGIN:
+        return entry[0]
+    return None
+
+
 def get_jwt_token(config):
     """
     Returns cached JWT token if valid, otherwise generates a new one.
     """
-    global _cached_token, _token_expiry
+    global _token_entry
+
+    jwt_config = config['jwt']
+    # A change to any of these settings through the Web UI invalidates the cached token
+    settings = (
+        jwt_config['secret'],
+        jwt_config['algorithm'],
+        jwt_config['issuer'],
+        jwt_config['expiration_minutes']
+    )
+
+    # Fast path: no lock while the cached token is usable
+    token = _usable_token(_token_entry, settings)
+    if token:
+        return token
 
-    # Checking if the token has expired
-    if _cached_token and time.time() < _token_expiry:
-        return _cached_token
+    with _token_lock:
+        # Another thread may have refreshed it while we waited
+        token = _usable_token(_token_entry, settings)
+        if token:
+            return token
 
-    # Generating a new token
-    token = generate_jwt_token(config)
-    if not token:
-        return None
+        # Generating a new token; its exp is known from the settings, no need to decode it
+        issued_at = time.time()
+        token = generate_jwt_token(config)
+        if not token:
+            return None
 
-    # Extracting the expiration time from the token
-    try:
-        decoded = jwt.decode(token, options={"verify_signature": False})
-        _token_expiry = decoded.get("exp", 0)
-    except Exception as e:
-        logger.warning(f"Cannot decode token expiration: {e}")
-        # fallback — If exp is not found, set it manually
-        _token_expiry = time.time() + 300  # 5 min
+        expiry = issued_at + jwt_config['expiration_minutes'] * 60
+        _token_entry = (token, expiry, settings)
 
-    _cached_token = token
-    logger.debug(f"Generated new JWT token (expires at {_token_expiry})")
+    logger.debug("Generated new JWT token (expires at %s)", expiry)
     return token
 
 
@@ -53,18 +76,20 @@ def generate_jwt_token(config):
             str: JWT token or None on error
     """
     try:
+        # NumericDate claims as ints, as PyJWT would produce from datetimes;
+        # the clock is read once for both
+        jwt_config = config['jwt']
+        now = int(time.time())
         payload = {
-            'iss': config['jwt']['issuer'],
-            'exp': datetime.now(timezone.utc) + timedelta(
-                minutes=config['jwt']['expiration_minutes']
-            ),
-            'iat': datetime.now(timezone.utc)
+            'iss': jwt_config['issuer'],
+            'exp': now + int(jwt_config['expiration_minutes'] * 60),
+            'iat': now
         }
 
         token = jwt.encode(
             payload,
-            config['jwt']['secret'],
-            algorithm=config['jwt']['algorithm']
+            jwt_config['secret'],
+            algorithm=jwt_config['algorithm']
         )
 
         return token
@@ -1,13 +1,100 @@
 """Configuration management"""
 
 import os
+import copy
+import json
+import tempfile
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
 
+# LibYAML bindings are much faster; fall back to the pure-Python classes
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    YAML_BACKEND = 'LibYAML'
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    YAML_BACKEND = 'pure Python'
+
 # Loads environment variables
 load_dotenv()
 
+CONFIG_PATH = Path(__file__).parent.parent / 'config.yaml'
+
+# JSON copy of the parsed config.yaml, read at startup instead of parsing YAML.
+# Stores the mtime and size of the config.yaml it was made from, so it is
+# also ignored if an older config.yaml is restored (e.g. by git checkout).
+SIDECAR_PATH = CONFIG_PATH.with_name('.config.yaml.json')
+
+# Parsed config.yaml: (st_mtime_ns, st_size, config), or None
+_config_cache = None
+
+
+def _read_sidecar(st):
+    """Returns the config from the JSON sidecar if it matches config.yaml's stat, else None"""
+    try:
+        with open(SIDECAR_PATH, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if sidecar.get('mtime_ns') != st.st_mtime_ns or sidecar.get('size') != st.st_size:
+        return None
+    return sidecar.get('config')
+
+
+def _write_sidecar(st, config):
+    """
+    Writes the JSON sidecar atomically
+
+    Only a config that JSON reproduces exactly is cached: YAML dates, tuples
+    or non-string keys would come back from the sidecar as other types, so
+    such a config (or a read-only directory) is left without a sidecar.
+    """
+    try:
+        data = json.dumps({'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'config': config})
+    except (TypeError, ValueError):
+        return
+
+    if json.loads(data)['config'] != config:
+        return
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=SIDECAR_PATH.parent, prefix='.config-', suffix='.json')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, SIDECAR_PATH)
+    except OSError:
+        os.unlink(tmp_path)
+
+
+def _read_config_file(config_path):
+    """
+    Parses config.yaml, reusing the last result while the file's mtime and size are unchanged
+
+    Returns:
+        dict: A fresh copy of the parsed configuration, safe for the caller to modify
+    """
+    global _config_cache
+
+    st = config_path.stat()
+    cached = _config_cache
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
+    config = _read_sidecar(st)
+    if config is None:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=SafeLoader)
+        _write_sidecar(st, config)
+
+    _config_cache = (st.st_mtime_ns, st.st_size, config)
+    return copy.deepcopy(config)
+
 
 def load_config():
     """
@@ -22,11 +109,10 @@ def load_config():
     else:
         load_dotenv()
 
-    config_path = Path(__file__).parent.parent / 'config.yaml'
+    config_path = CONFIG_PATH
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _read_config_file(config_path)
 
         # Overriding from environment variables (REQUIRED)
         jwt_secret = os.getenv('JWT_SECRET')
@@ -61,6 +147,10 @@ def load_config():
         if os.getenv('PROCESSED_DIR'):
             config['watcher']['processed_directory'] = os.getenv('PROCESSED_DIR')
 
+        # Polling for bind mounts that do not deliver inotify events (Docker Desktop on Windows, SMB)
+        if os.getenv('DOCKER_POLL') == '1':
+            config['watcher']['force_polling'] = True
+
         # Email password from env
         if os.getenv('EMAIL_PASSWORD'):
             config['notifications']['email']['password'] = os.getenv('EMAIL_PASSWORD')
@@ -82,7 +172,14 @@ def save_config(config):
     Args:
         config (dict): Configuration to save
     """
-    config_path = Path(__file__).parent.parent / 'config.yaml'
+    global _config_cache
+
+    with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
+        yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
 
-    with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
\ No newline at end of file
+    # Next load_config parses the new content
+    _config_cache = None
+    try:
+        SIDECAR_PATH.unlink()
+    except FileNotFoundError:
+        pass
\ No newline at end of file
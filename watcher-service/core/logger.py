@@ -2,21 +2,32 @@
 Setting up the logging system
 """
 
+import queue
+import atexit
 import logging
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Writes the queued log records to the file and the console
+_listener = None
 
 
 def setup_logging(config):
     """
     Configures logging with file rotation
 
+    Records are put on a queue by the logging threads and written to the
+    file and the console by a listener thread, so file events are never
+    held up by log writes.
+
     Args:
         config (dict): Application Configuration
 
     Returns:
         logging.Logger: Configured logger
     """
+    global _listener
+
     # Create a folder for logs if it doesn't exist.
     log_dir = Path(config['logging']['file']).parent
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -45,10 +56,30 @@ def setup_logging(config):
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
 
+    # Both handlers are driven by the listener thread; the root logger only queues.
+    # Levels are applied on the root logger and its QueueHandler, which is
+    # where PUT /config/logging changes them at runtime, so the listener
+    # does not filter again with the handlers' startup level
+    if _listener is not None:
+        _listener.stop()
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=False)
+    _listener.start()
+
     # Setting up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    return root_logger
+
+
+def stop_logging():
+    """Writes out the queued log records and stops the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
-    return root_logger
\ No newline at end of file
+atexit.register(stop_logging)
@@ -2,8 +2,22 @@
 Service statistics management
 """
 
-from datetime import datetime, timezone
-from pathlib import Path
+import os
+import time
+import threading
+from datetime import date
+
+# Housekeeping files that are not counted as pending (also used by the /files endpoints)
+IGNORED_FILES = frozenset({'.gitkeep', '.gitignore', '.DS_Store', 'Thumbs.db'})
+
+# The pending count only changes when entries are added or removed, which
+# updates the directory mtime. It is reused while that mtime is unchanged,
+# for at most PENDING_COUNT_TTL seconds (mtimes can be coarser than the
+# time between two changes)
+PENDING_COUNT_TTL = 2
+
+# Ordinal of 1970-01-01, for converting epoch days to dates
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
 class Stats:
@@ -13,25 +27,56 @@ class Stats:
         self.total_processed = 0
         self.today_processed = 0
         self.failed = 0
-        self.last_reset = datetime.now(timezone.utc).date()
+        # UTC day (days since the epoch) of the last daily reset: an int,
+        # so the per-update date check builds no datetime objects
+        self._last_reset_day = int(time.time()) // 86400
+        # Files are processed on several worker threads
+        self._lock = threading.Lock()
+        # (watch directory, st_mtime_ns, expiry, count) of the last pending count
+        self._pending_cache = None
 
     def increment_processed(self):
         """Increments the counter for successfully processed files"""
-        self._check_date_reset()
-        self.total_processed += 1
-        self.today_processed += 1
+        with self._lock:
+            self._check_date_reset()
+            self.total_processed += 1
+            self.today_processed += 1
 
     def increment_failed(self):
         """Increments the counter for failed files"""
-        self._check_date_reset()
-        self.failed += 1
+        with self._lock:
+            self._check_date_reset()
+            self.failed += 1
+
+    def reset(self):
+        """Resets all counters"""
+        with self._lock:
+            self.total_processed = 0
+            self.today_processed = 0
+            self.failed = 0
+
+    @property
+    def last_reset(self):
+        """UTC date of the last daily reset"""
+        return date.fromordinal(_EPOCH_ORDINAL + self._last_reset_day)
 
     def _check_date_reset(self):
         """Resets daily statistics if the date has changed"""
-        today = datetime.now(timezone.utc).date()
-        if today != self.last_reset:
+        today = int(time.time()) // 86400
+        if today != self._last_reset_day:
             self.today_processed = 0
-            self.last_reset = today
+            self._last_reset_day = today
+
+    def snapshot(self):
+        """
+        Reads all counters at once
+
+        Returns:
+            tuple: (total_processed, today_processed, failed)
+        """
+        with self._lock:
+            self._check_date_reset()
+            return self.total_processed, self.today_processed, self.failed
 
     def get_success_rate(self):
         """
@@ -40,10 +85,16 @@ class Stats:
         Returns:
             float: Success rate (0–100)
         """
-        total = self.total_processed + self.failed
+        processed, _, failed = self.snapshot()
+        return self._success_rate(processed, failed)
+
+    @staticmethod
+    def _success_rate(processed, failed):
+        """Success rate (0–100) for the given counter values"""
+        total = processed + failed
         if total == 0:
             return 100.0
-        return round((self.total_processed / total) * 100, 1)
+        return round((processed / total) * 100, 1)
 
     def get_pending_count(self, config):
         """
@@ -55,17 +106,30 @@ class Stats:
         Returns:
             int: Number of pending files
         """
-        watched_dir = Path(config['watcher']['watch_directory'])
-        if not watched_dir.exists():
+        watch_dir = config['watcher']['watch_directory']
+
+        try:
+            dir_mtime = os.stat(watch_dir).st_mtime_ns
+        except FileNotFoundError:
             return 0
 
-        ignored_patterns = {'.gitkeep', '.gitignore', '.DS_Store', 'Thumbs.db'}
-        pending_count = sum(
-            1 for f in watched_dir.glob('*')
-            if f.is_file() and f.name not in ignored_patterns
-        ) if watched_dir.exists() else 0
+        now = time.monotonic()
+        cached = self._pending_cache
+        if cached and cached[0] == watch_dir and cached[1] == dir_mtime and now < cached[2]:
+            return cached[3]
+
+        # DirEntry gives the name and file type without a Path object or stat per entry
+        try:
+            with os.scandir(watch_dir) as entries:
+                count = sum(
+                    1 for entry in entries
+                    if entry.name not in IGNORED_FILES and entry.is_file()
+                )
+        except FileNotFoundError:
+            return 0
 
-        return pending_count  # len(list(watched_dir.glob('*')))
+        self._pending_cache = (watch_dir, dir_mtime, now + PENDING_COUNT_TTL, count)
+        return count
 
     def to_dict(self, config=None):
         """
@@ -77,11 +141,14 @@ class Stats:
         Returns:
             dict: Statistics
         """
+        # One snapshot, so the counters and the rate agree
+        total_processed, today_processed, failed = self.snapshot()
+
         result = {
-            'total_processed': self.total_processed,
-            'today_processed': self.today_processed,
-            'failed': self.failed,
-            'success_rate': self.get_success_rate()
+            'total_processed': total_processed,
+            'today_processed': today_processed,
+            'failed': failed,
+            'success_rate': self._success_rate(total_processed, failed)
         }
 
         if config:
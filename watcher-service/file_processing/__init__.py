@@ -2,12 +2,13 @@
 File processing
 """
 
-from .hash_calculator import calculate_file_hash
+from .hash_calculator import calculate_file_hash, stat_and_hash_file
 from .metadata import extract_metadata, validate_metadata
 from .file_mover import move_file_to_processed, copy_file_to_processed
 
 __all__ = [
     'calculate_file_hash',
+    'stat_and_hash_file',
     'extract_metadata',
     'validate_metadata',
     'move_file_to_processed',
@@ -2,13 +2,81 @@
 Move or copy files to the processed directory
 """
 
+import os
+import errno
 import shutil
 import logging
+import itertools
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Processed directories by configured path, created on first use
+# instead of once per file
+_processed_dirs = {}
+
+# Set once the cross-filesystem warning has been logged
+_cross_device_warned = False
+
+
+def _processed_dir(config):
+    """Returns the processed directory as a Path, creating it the first time it is used"""
+    directory = config['watcher']['processed_directory']
+
+    path = _processed_dirs.get(directory)
+    if path is None:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        _processed_dirs[directory] = path
+
+    return path
+
+
+def _candidate_names(source):
+    """File names to try for source: its own, then with a timestamp, then timestamp and counter"""
+    yield source.name
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    yield f"{source.stem}_{timestamp}{source.suffix}"
+
+    # Several files with the same name within one second
+    for n in itertools.count(1):
+        yield f"{source.stem}_{timestamp}_{n}{source.suffix}"
+
+
+def _claim_destination(processed_dir, source):
+    """
+    Reserves a free target path for source in processed_dir
+
+    The name is claimed by creating an empty placeholder with O_EXCL, which
+    fails instead of reusing an existing file, so concurrent workers can
+    never pick the same name. The caller replaces the placeholder.
+
+    Returns:
+        Path: The reserved path
+    """
+    for name in _candidate_names(source):
+        destination = processed_dir / name
+        try:
+            fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return destination
+
+
+def _warn_cross_device(source, processed_dir):
+    """Logs once that files are copied because the directories are on different filesystems"""
+    global _cross_device_warned
+
+    if not _cross_device_warned:
+        _cross_device_warned = True
+        logger.warning(
+            "⚠️ %s and %s are on different filesystems: files are copied instead of renamed",
+            source.parent, processed_dir
+        )
+
 
 def move_file_to_processed(filepath, config):
     """
@@ -23,27 +91,53 @@ def move_file_to_processed(filepath, config):
     """
     try:
         source = Path(filepath)
-        processed_dir = Path(config['watcher']['processed_directory'])
-
-        # Create the folder if it doesn't exist
-        processed_dir.mkdir(parents=True, exist_ok=True)
+        processed_dir = _processed_dir(config)
 
         # Target path
         destination = processed_dir / source.name
 
-        # If file already exists, add a timestamp
-        if destination.exists():
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            destination = processed_dir / f"{source.stem}_{timestamp}{source.suffix}"
-
-        # Move the file
-        shutil.move(str(source), str(destination))
-
-        logger.info(f"✅ Moved file to: {destination}")
+        # Fast path: a hard link never replaces an existing file, so it
+        # doubles as the existence check, and no other process can take
+        # the name between the check and the move
+        try:
+            os.link(source, destination, follow_symlinks=False)
+        except (OSError, NotImplementedError):
+            # Name taken, different filesystem, or no hard link support
+            # (follow_symlinks=False raises NotImplementedError on Windows)
+            pass
+        else:
+            try:
+                os.unlink(source)
+            except OSError:
+                # Source still locked by its writer, for example: the link is
+                # removed again so no copy is left behind in processed/
+                destination.unlink(missing_ok=True)
+            else:
+                logger.info("✅ Moved file to: %s", destination)
+                return True, str(destination)
+
+        destination = _claim_destination(processed_dir, source)
+
+        # Move the file over the placeholder: a single rename, unless the
+        # directories are on different filesystems or mounts (EXDEV), where
+        # shutil.move copies
+        try:
+            try:
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                _warn_cross_device(source, processed_dir)
+                shutil.move(str(source), str(destination))
+        except BaseException:
+            destination.unlink(missing_ok=True)
+            raise
+
+        logger.info("✅ Moved file to: %s", destination)
         return True, str(destination)
 
     except Exception as e:
-        logger.error(f"Failed to move file {filepath}: {e}")
+        logger.error("Failed to move file %s: %s", filepath, e)
         return False, None
 
 
@@ -60,25 +154,18 @@ def copy_file_to_processed(filepath, config):
     """
     try:
         source = Path(filepath)
-        processed_dir = Path(config['watcher']['processed_directory'])
-
-        # Create the folder if it doesn't exist
-        processed_dir.mkdir(parents=True, exist_ok=True)
-
-        # Target path
-        destination = processed_dir / source.name
-
-        # If file already exists, add a timestamp
-        if destination.exists():
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            destination = processed_dir / f"{source.stem}_{timestamp}{source.suffix}"
+        destination = _claim_destination(_processed_dir(config), source)
 
-        # Copy the file
-        shutil.copy2(str(source), str(destination))
+        # Copy the file over the placeholder
+        try:
+            shutil.copy2(str(source), str(destination))
+        except BaseException:
+            destination.unlink(missing_ok=True)
+            raise
 
-        logger.info(f"✅ Copied file to: {destination}")
+        logger.info("✅ Copied file to: %s", destination)
         return True, str(destination)
 
     except Exception as e:
-        logger.error(f"Failed to copy file {filepath}: {e}")
+        logger.error("Failed to copy file %s: %s", filepath, e)
         return False, None
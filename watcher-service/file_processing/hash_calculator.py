@@ -2,31 +2,110 @@
 Calculating file hashes
 """
 
-import hashlib
-import logging
-
-logger = logging.getLogger(__name__)
-
+import os
+import mmap
 import hashlib
 import time
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+# Optional: BLAKE3 (pip install blake3), a fast non-standard alternative to SHA-256
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 logger = logging.getLogger(__name__)
 
+# Block size for the manual read loop used when hashlib.file_digest is unavailable
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Hashes of recently hashed files, keyed on (algorithm, st_dev, st_ino,
+# st_mtime_ns, st_size): a file that is hashed again unchanged (a retry, or
+# the same file seen twice in a burst) is not read again. Least recently
+# used entries are dropped beyond HASH_CACHE_SIZE
+HASH_CACHE_SIZE = 10000
+_hash_cache = OrderedDict()
+_hash_cache_lock = threading.Lock()
+
+
+def _cached_hash(key):
+    """Returns the cached hash for key, or None"""
+    with _hash_cache_lock:
+        digest = _hash_cache.get(key)
+        if digest is not None:
+            _hash_cache.move_to_end(key)
+        return digest
+
+
+def _cache_hash(key, digest):
+    """Remembers the hash for key, dropping the least recently used entry when full"""
+    with _hash_cache_lock:
+        _hash_cache[key] = digest
+        _hash_cache.move_to_end(key)
+        if len(_hash_cache) > HASH_CACHE_SIZE:
+            _hash_cache.popitem(last=False)
 
-def calculate_file_hash(filepath, algorithm='sha256', max_retries=3, retry_delay=0.5):
+
+def _hash_file_object(f, hash_obj):
     """
-    Calculates the file hash with retry logic
+    Feeds an open binary file into hash_obj
+
+    Uses hashlib.file_digest (Python 3.11+), which reads and hashes in C,
+    or a readinto loop over a 1 MB buffer on older versions.
+    """
+    # Files are read front to back once: let the kernel read ahead further
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(f, lambda: hash_obj)
+
+    # One reusable buffer instead of a new bytes object per block
+    buffer = bytearray(HASH_BLOCK_SIZE)
+    view = memoryview(buffer)
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        hash_obj.update(view[:size])
+    return hash_obj
+
+
+def _hash_mapped_file(f, hash_obj):
+    """Hashes an open binary file through a read-only memory map, in one update() call"""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        hash_obj.update(mm)
+    return hash_obj
+
+
+def stat_and_hash_file(filepath, algorithm='sha256', max_retries=3, retry_delay=0.5, mmap_threshold=None):
+    """
+    Opens a file once and returns its stat and hash, with retry logic
+
+    The size comes from fstat on the descriptor that is hashed, so it
+    always describes the content the hash was computed from. A file whose
+    device, inode, mtime and size match a recently hashed one is not read
+    again.
 
     Args:
         filepath (str|Path): Path to the file
-        algorithm (str): Hashing algorithm (sha256, md5, sha1)
+        algorithm (str): Hashing algorithm (sha256, md5, sha1, blake3)
         max_retries (int): Maximum number of retry attempts
         retry_delay (float): Delay between retries in seconds
+        mmap_threshold (int): Files of at least this many bytes are hashed through mmap
+            (None disables it). A mapped file that is truncated by another process
+            while it is hashed crashes the process with SIGBUS, so this is opt-in.
 
     Returns:
-        str: File hash in hexadecimal format, or None in case of an error
+        tuple: (os.stat_result, hash in hexadecimal format), or None in case of an error
     """
     for attempt in range(max_retries):
         try:
@@ -37,36 +116,81 @@ def calculate_file_hash(filepath, algorithm='sha256', max_retries=3, retry_delay
                 hash_obj = hashlib.md5()
             elif algorithm == 'sha1':
                 hash_obj = hashlib.sha1()
+            elif algorithm == 'blake3':
+                if blake3 is None:
+                    raise ValueError("Hash algorithm blake3 requires the blake3 package")
+                # Multithreaded for large inputs, e.g. a whole memory-mapped file
+                hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
             else:
                 raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
-            # Reading the file in blocks to save memory
-            with open(filepath, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    hash_obj.update(byte_block)
+            # Reading the file in blocks to save memory. Unbuffered: the blocks
+            # are large, so a BufferedReader would only add a copy
+            with open(filepath, "rb", buffering=0) as f:
+                file_stat = os.fstat(f.fileno())
+
+                cache_key = (
+                    algorithm, file_stat.st_dev, file_stat.st_ino,
+                    file_stat.st_mtime_ns, file_stat.st_size
+                )
+                digest = _cached_hash(cache_key)
+                if digest is not None:
+                    logger.debug("Hash cache hit for %s", filepath)
+                    return file_stat, digest
+
+                if mmap_threshold and file_stat.st_size >= mmap_threshold:
+                    hash_obj = _hash_mapped_file(f, hash_obj)
+                else:
+                    hash_obj = _hash_file_object(f, hash_obj)
 
             # Success - return hash
             if attempt > 0:
-                logger.info(f"Successfully calculated hash for {filepath} on attempt {attempt + 1}")
+                logger.info("Successfully calculated hash for %s on attempt %d", filepath, attempt + 1)
 
-            return hash_obj.hexdigest()
+            digest = hash_obj.hexdigest()
+            _cache_hash(cache_key, digest)
+            return file_stat, digest
+
+        except FileNotFoundError:
+            logger.error("File does not exist: %s", filepath)
+            return None
 
         except PermissionError as e:
             if attempt < max_retries - 1:
                 logger.warning(
-                    f"Permission denied for {filepath}, "
-                    f"retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})"
+                    "Permission denied for %s, retrying in %ss (attempt %d/%d)",
+                    filepath, retry_delay, attempt + 1, max_retries
                 )
                 time.sleep(retry_delay)
             else:
                 logger.error(
-                    f"Failed to calculate hash for {filepath} after {max_retries} attempts: "
-                    f"Permission denied (file may be locked by another process)"
+                    "Failed to calculate hash for %s after %d attempts: "
+                    "Permission denied (file may be locked by another process)",
+                    filepath, max_retries
                 )
                 return None
 
         except Exception as e:
-            logger.error(f"Failed to calculate hash for {filepath}: {e}")
+            logger.error("Failed to calculate hash for %s: %s", filepath, e)
             return None
 
     return None
+
+
+def calculate_file_hash(filepath, algorithm='sha256', max_retries=3, retry_delay=0.5, mmap_threshold=None):
+    """
+    Calculates the file hash with retry logic
+
+    Args:
+        filepath (str|Path): Path to the file
+        algorithm (str): Hashing algorithm (sha256, md5, sha1, blake3)
+        max_retries (int): Maximum number of retry attempts
+        retry_delay (float): Delay between retries in seconds
+        mmap_threshold (int): Files of at least this many bytes are hashed through mmap
+            (None disables it), see stat_and_hash_file
+
+    Returns:
+        str: File hash in hexadecimal format, or None in case of an error
+    """
+    result = stat_and_hash_file(filepath, algorithm, max_retries, retry_delay, mmap_threshold)
+    return result[1] if result else None
@@ -2,45 +2,64 @@
 Extracting file metadata
 """
 
+import os
+import time
 import logging
-from pathlib import Path
-from datetime import datetime, timezone
-from .hash_calculator import calculate_file_hash
+import functools
+from .hash_calculator import stat_and_hash_file
 
 logger = logging.getLogger(__name__)
 
 
-def extract_metadata(filepath):
+@functools.lru_cache(maxsize=2)
+def _iso_second(seconds):
+    """ISO 8601 UTC date and time for an epoch second (two entries cover a second boundary)"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+
+
+def _iso_now():
+    """
+    Current UTC time in ISO 8601 with microseconds, e.g. 2025-01-31T12:00:00.123456+00:00
+
+    Same format as datetime.now(timezone.utc).isoformat(), without building
+    a datetime per file; only the fraction is formatted on every call.
+    """
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second(seconds)}.{nanoseconds // 1000:06d}+00:00"
+
+
+def extract_metadata(filepath, mmap_threshold=None, algorithm='sha256'):
     """
     Retrieves file metadata.
 
     Args:
         filepath (str|Path): File path.
+        mmap_threshold (int): Size from which the hash is computed through mmap (None = never).
+        algorithm (str): Hashing algorithm, see calculate_file_hash.
 
     Returns:
         dict: File metadata, or None on error.
     """
     try:
-        file_path = Path(filepath)
-
-        if not file_path.exists():
-            logger.error(f"File does not exist: {filepath}")
+        # One open for both: the size comes from fstat on the descriptor being hashed
+        result = stat_and_hash_file(filepath, algorithm, mmap_threshold=mmap_threshold)
+        if result is None:
             return None
 
-        file_stat = file_path.stat()
+        file_stat, file_hash = result
 
         metadata = {
-            'filename': file_path.name,
-            'created_at': datetime.now(timezone.utc).isoformat(),
+            'filename': os.path.basename(filepath),
+            'created_at': _iso_now(),
             'file_size': file_stat.st_size,
-            'hash': calculate_file_hash(filepath)
+            'hash': file_hash
         }
 
-        logger.debug(f"Extracted metadata: {metadata}")
+        logger.debug("Extracted metadata: %s", metadata)
         return metadata
 
     except Exception as e:
-        logger.error(f"Failed to extract metadata from {filepath}: {e}")
+        logger.error("Failed to extract metadata from %s: %s", filepath, e)
         return None
 
 
@@ -61,11 +80,11 @@ def validate_metadata(metadata):
 
     for field in required_fields:
         if field not in metadata:
-            logger.error(f"Missing required field: {field}")
+            logger.error("Missing required field: %s", field)
             return False
 
         if metadata[field] is None:
-            logger.error(f"Field {field} is None")
+            logger.error("Field %s is None", field)
             return False
 
     return True
\ No newline at end of file
@@ -2,9 +2,14 @@
 Integration with external services
 """
 
-from .logger_client import send_metadata_to_logger, test_logger_connection
+from .logger_client import send_metadata_to_logger, test_logger_connection, get_http_session, close_http_session
+from .metadata_batcher import MetadataBatcher, send_metadata
 
 __all__ = [
     'send_metadata_to_logger',
-    'test_logger_connection'
+    'test_logger_connection',
+    'get_http_session',
+    'close_http_session',
+    'MetadataBatcher',
+    'send_metadata'
 ]
\ No newline at end of file
@@ -2,12 +2,77 @@
 Client for interaction with Logger Service
 """
 
+import json
 import logging
+import functools
 import requests
-from auth.jwt_handler import get_jwt_token, generate_jwt_token
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from auth.jwt_handler import get_jwt_token
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Result message when the Logger Service could not be reached at all. Nothing
+# was sent in that case, so the caller may safely retry
+CONNECT_ERROR = "Cannot connect to Logger Service"
+
+# One session for all Logger Service calls: keep-alive connections are pooled
+# instead of opening a new TCP connection per file. Connection failures are
+# retried for every method. Gateway errors are retried for GET/HEAD only
+# (health checks), so a POST is never sent twice.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        connect=2,
+        read=0,
+        status=2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        backoff_factor=0.1,
+        raise_on_status=False
+    )
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+
+def get_http_session():
+    """Returns the shared requests.Session used for Logger Service calls"""
+    return _session
+
+
+def close_http_session():
+    """Closes the pooled Logger Service connections. Called on shutdown, after the last upload"""
+    _session.close()
+
+
+def encode_json(obj):
+    """
+    Serializes a request body to UTF-8 JSON bytes, with orjson when it is installed
+
+    Passed to requests as data=, together with json_headers(), instead of json=
+    (which runs the stdlib encoder inside requests).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_headers(token):
+    """Headers for an authenticated JSON request to the Logger Service"""
+    return {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json'
+    }
+
 
 def send_metadata_to_logger(metadata, config):
     """
@@ -27,54 +92,53 @@ def send_metadata_to_logger(metadata, config):
             return False, "Failed to generate JWT token"
 
         # Preparing a request
-        url = config['logger_service']['url']
-
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
-
-        timeout = config['logger_service'].get('timeout', 10)
+        logger_config = config['logger_service']
+        url = logger_config['url']
+        timeout = logger_config.get('timeout', 10)
 
-        logger.debug(f"Sending metadata to {url}")
+        logger.debug("Sending metadata to %s", url)
 
         # Sending a POST request
-        response = requests.post(
+        response = _session.post(
             url,
-            json=metadata,
-            headers=headers,
+            data=encode_json(metadata),
+            headers=json_headers(token),
             timeout=timeout
         )
 
         # Checking the status
         if response.status_code == 200:
-            logger.info(f"✅ Metadata sent successfully for: {metadata['filename']}")
+            logger.info("✅ Metadata sent successfully for: %s", metadata['filename'])
             return True, response.json()
         else:
             error_msg = f"Logger returned {response.status_code}: {response.text}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             return False, error_msg
 
     except requests.exceptions.Timeout:
         error_msg = f"Timeout connecting to Logger Service ({timeout}s)"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return False, error_msg
 
     except requests.exceptions.ConnectionError:
-        error_msg = "Cannot connect to Logger Service"
-        logger.error(f"❌ {error_msg}")
+        error_msg = CONNECT_ERROR
+        logger.error("❌ %s", error_msg)
         return False, error_msg
 
     except Exception as e:
         error_msg = f"Failed to send metadata: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return False, error_msg
 
+@functools.lru_cache(maxsize=4)
+def _derive_health_url(logger_url):
+    """Health URL for a logger URL, remembered for the few URLs the service sees"""
+    return logger_url.rsplit('/log', 1)[0] + '/health'
+
+
 def get_logger_health_url(config):
     """Get health URL from logger URL"""
-    logger_url = config['logger_service']['url']
-    health_url = logger_url.rsplit('/log', 1)[0] + '/health'
-    return health_url
+    return _derive_health_url(config['logger_service']['url'])
 
 def test_logger_connection(config, logger):
     """
@@ -88,13 +152,13 @@ def test_logger_connection(config, logger):
         logger.info("🔍 Checking Logger Service availability...")
 
         health_url = get_logger_health_url(config)
-        response = requests.get(health_url, timeout=5)
+        response = _session.get(health_url, timeout=5)
 
         if response.status_code == 200:
             logger.info("✅ Logger Service is available")
         else:
-            logger.warning(f"⚠️ Logger Service returned status {response.status_code}")
+            logger.warning("⚠️ Logger Service returned status %d", response.status_code)
 
     except Exception as e:
-        logger.warning(f"⚠️ Cannot connect to Logger Service: {e}")
+        logger.warning("⚠️ Cannot connect to Logger Service: %s", e)
         logger.warning("   Will retry on file events")
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Batching of metadata uploads to the Logger Service
+"""
+
+import queue
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+import requests
+from auth.jwt_handler import get_jwt_token
+from .logger_client import CONNECT_ERROR, encode_json, get_http_session, json_headers, send_metadata_to_logger
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataBatcher:
+    """
+    Collects metadata from the file workers and sends it in batches.
+
+    A background thread takes the first queued record, waits up to
+    flush_interval for more (at most batch_size in total) and sends them
+    in one POST to <logger url>/batch. If the Logger Service does not
+    have the batch endpoint (404), every later record is sent on its own
+    through send_metadata_to_logger.
+
+    Each file worker waits for its own record before moving the file, so
+    at most watcher.parallelism records are ever queued; larger batch
+    sizes are capped to that (see get_metadata_batcher).
+    """
+
+    def __init__(self, batch_size=4, flush_interval=0.1):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.batch_supported = True
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='metadata-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, metadata, config):
+        """
+        Queues metadata for sending
+
+        Args:
+            metadata (dict): File metadata
+            config (dict): Application configuration
+
+        Returns:
+            Future: Resolves to (success: bool, response: dict|str), as from send_metadata_to_logger
+        """
+        future = Future()
+        self._queue.put((metadata, config, future))
+        return future
+
+    def _run(self):
+        """Batcher thread loop"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._send(batch)
+            except Exception as e:
+                error_msg = f"Failed to send metadata: {str(e)}"
+                logger.error("❌ %s", error_msg)
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result((False, error_msg))
+
+    def _send(self, batch):
+        """Sends one batch, resolving the future of every record in it"""
+        config = batch[0][1]
+
+        if len(batch) == 1 or not self.batch_supported:
+            for metadata, item_config, future in batch:
+                future.set_result(send_metadata_to_logger(metadata, item_config))
+            return
+
+        token = get_jwt_token(config)
+        if not token:
+            for _, _, future in batch:
+                future.set_result((False, "Failed to generate JWT token"))
+            return
+
+        logger_config = config['logger_service']
+        url = logger_config['url'] + '/batch'
+        timeout = logger_config.get('timeout', 10)
+
+        logger.debug("Sending %d metadata records to %s", len(batch), url)
+
+        try:
+            response = get_http_session().post(
+                url,
+                data=encode_json([metadata for metadata, _, _ in batch]),
+                headers=json_headers(token),
+                timeout=timeout
+            )
+        except requests.exceptions.Timeout:
+            self._fail(batch, f"Timeout connecting to Logger Service ({timeout}s)")
+            return
+        except requests.exceptions.ConnectionError:
+            self._fail(batch, CONNECT_ERROR)
+            return
+
+        if response.status_code == 404:
+            logger.warning("⚠️ Logger Service has no batch endpoint, sending metadata one by one")
+            self.batch_supported = False
+            self._send(batch)
+            return
+
+        if response.status_code != 200:
+            self._fail(batch, f"Logger returned {response.status_code}: {response.text}")
+            return
+
+        results = response.json().get('results', [])
+        for (metadata, _, future), result in zip(batch, results):
+            if result.get('status') == 'success':
+                logger.info("✅ Metadata sent successfully for: %s", metadata['filename'])
+                future.set_result((True, result))
+            else:
+                error_msg = f"Logger rejected {metadata['filename']}: {result.get('error')}"
+                logger.error("❌ %s", error_msg)
+                future.set_result((False, error_msg))
+
+        # Entries the response did not cover
+        for metadata, _, future in batch[len(results):]:
+            future.set_result((False, f"No result from Logger Service for {metadata['filename']}"))
+
+    @staticmethod
+    def _fail(batch, error_msg):
+        """Resolves every record of a batch with the same error"""
+        logger.error("❌ %s", error_msg)
+        for _, _, future in batch:
+            future.set_result((False, error_msg))
+
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+# Set on shutdown: ends retry backoff waits early, so stopping is not held up
+# by a Logger Service outage
+_stop_retries = threading.Event()
+
+
+def stop_retries():
+    """Makes send_metadata give up waiting to retry; the pending attempt's failure is returned"""
+    _stop_retries.set()
+
+
+def get_metadata_batcher(config):
+    """Returns the shared MetadataBatcher, starting it on first use"""
+    global _batcher
+
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                # No more records than there are file workers can be pending at once
+                parallelism = max(1, config['watcher'].get('parallelism', 4))
+                _batcher = MetadataBatcher(
+                    batch_size=min(config['logger_service'].get('batch_size', parallelism), parallelism),
+                    flush_interval=config['logger_service'].get('batch_interval', 0.1)
+                )
+
+    return _batcher
+
+
+def send_metadata(metadata, config):
+    """
+    Sends metadata to the Logger Service, batched when logger_service.batch_size > 1
+
+    Batches hold at most watcher.parallelism records, one per file worker.
+
+    Blocks until the record has been sent. While the Logger Service cannot be
+    reached, the send is retried up to logger_service.retry_attempts times in
+    total, waiting retry_delay seconds, doubled after each attempt. The wait
+    ends early once stop_retries() has been called (shutdown).
+
+    Args:
+        metadata (dict): File metadata
+        config (dict): Application configuration
+
+    Returns:
+        tuple: (success: bool, response: dict|str)
+    """
+    logger_config = config['logger_service']
+    attempts = max(1, logger_config.get('retry_attempts', 1))
+    delay = logger_config.get('retry_delay', 0)
+
+    for attempt in range(attempts):
+        if logger_config.get('batch_size', 1) <= 1:
+            success, response = send_metadata_to_logger(metadata, config)
+        else:
+            success, response = get_metadata_batcher(config).submit(metadata, config).result()
+
+        # Only unreachable-service failures are retried: other errors may
+        # come after the Logger Service already stored the record
+        if success or response != CONNECT_ERROR or attempt == attempts - 1 or _stop_retries.is_set():
+            return success, response
+
+        wait = delay * (2 ** attempt)
+        logger.warning(
+            "⚠️ Logger Service unreachable, retrying %s in %ss (attempt %d/%d)",
+            metadata['filename'], wait, attempt + 1, attempts
+        )
+        if _stop_retries.wait(wait):
+            return success, response
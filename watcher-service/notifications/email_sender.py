@@ -3,12 +3,114 @@ Email notifications
 """
 
 import os
+import time
+import atexit
 import logging
-import smtplib
-from email.mime.text import MIMEText
+import threading
 
 logger = logging.getLogger(__name__)
 
+# One SMTP session reused across notifications, so a burst of emails pays for
+# connect + STARTTLS + login once. _smtp_key holds the settings it was opened
+# with; a change through the Web UI opens a new session.
+_smtp = None
+_smtp_key = None
+_smtp_lock = threading.Lock()
+
+
+def _close_smtp():
+    """Ends the shared SMTP session, if any. Called with _smtp_lock held or at exit"""
+    global _smtp, _smtp_key
+
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except Exception:
+            pass
+    _smtp = None
+    _smtp_key = None
+
+
+# Say QUIT to the server on shutdown instead of dropping the connection
+atexit.register(_close_smtp)
+
+# Error emails per error type: (monotonic time of the last one sent, number
+# suppressed since). While the Logger Service is down every file fails the
+# same way; one email per interval is sent for it
+_error_emails = {}
+_error_emails_lock = threading.Lock()
+
+# Default for notifications.email.error_interval
+ERROR_EMAIL_INTERVAL = 60
+
+# Bound on _error_emails; the least recently emailed types are dropped beyond it
+ERROR_EMAIL_KEYS_MAX = 64
+
+
+def _claim_error_email(key, interval):
+    """
+    Decides whether an error email for key may be sent now
+
+    Entries whose interval has passed with nothing suppressed are dropped on
+    every claim, and the dict never holds more than ERROR_EMAIL_KEYS_MAX keys.
+
+    Returns:
+        int|None: None if one was sent less than interval seconds ago (it is
+        counted as suppressed), otherwise the number suppressed since the last one
+    """
+    now = time.monotonic()
+
+    with _error_emails_lock:
+        entry = _error_emails.get(key)
+        if entry is not None and now - entry[0] < interval:
+            _error_emails[key] = (entry[0], entry[1] + 1)
+            return None
+
+        # Expired entries carry nothing to report
+        for stale_key in [k for k, (sent, suppressed) in _error_emails.items()
+                          if not suppressed and now - sent >= interval]:
+            del _error_emails[stale_key]
+
+        _error_emails.pop(key, None)
+        while len(_error_emails) >= ERROR_EMAIL_KEYS_MAX:
+            del _error_emails[min(_error_emails, key=lambda k: _error_emails[k][0])]
+
+        _error_emails[key] = (now, 0)
+        return entry[1] if entry is not None else 0
+
+
+def _get_smtp(smtp_host, smtp_port, email_from, email_password, use_tls):
+    """
+    Returns a live SMTP session for the given settings. Called with _smtp_lock held
+
+    The cached session is checked with NOOP (servers drop idle clients)
+    and replaced when it no longer answers or the settings changed.
+    """
+    global _smtp, _smtp_key
+    import smtplib
+
+    key = (smtp_host, smtp_port, email_from, email_password, use_tls)
+    if _smtp is not None and _smtp_key == key:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    _close_smtp()
+
+    server = smtplib.SMTP(smtp_host, smtp_port, timeout=10)
+    try:
+        if use_tls:
+            server.starttls()
+        server.login(email_from, email_password)
+    except BaseException:
+        server.close()
+        raise
+
+    _smtp, _smtp_key = server, key
+    return server
+
 
 def send_email_notification(config, subject, message):
     """
@@ -51,45 +153,74 @@ def send_email_notification(config, subject, message):
             logger.error("SMTP host not set (set EMAIL_SMTP_HOST env or 'smtp_host' in config.yaml)")
             return
 
+        # Imported here: most deployments run with email disabled
+        import smtplib
+        from email.mime.text import MIMEText
+
         msg = MIMEText(message)
         msg['Subject'] = f"[Watcher Service] {subject}"
         msg['From'] = email_from
         msg['To'] = email_to
 
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as server:
-            if email_config.get('use_tls', True):
-                server.starttls()
-
-            server.login(email_from, email_password)
-            server.send_message(msg)
+        use_tls = email_config.get('use_tls', True)
+        with _smtp_lock:
+            server = _get_smtp(smtp_host, smtp_port, email_from, email_password, use_tls)
+            try:
+                server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                # Dropped between NOOP and send: one retry on a fresh session
+                _close_smtp()
+                server = _get_smtp(smtp_host, smtp_port, email_from, email_password, use_tls)
+                server.send_message(msg)
 
-        logger.info(f"📧 Email notification sent: {subject}")
+        logger.info("📧 Email notification sent: %s", subject)
 
     except KeyError as e:
-        logger.error(f"Configuration error - missing key: {e}")
-        logger.error(f"Email config structure: {config.get('notifications', {}).get('email', {})}")
+        logger.error("Configuration error - missing key: %s", e)
+        logger.error("Email config structure: %s", config.get('notifications', {}).get('email', {}))
     except Exception as e:
-        logger.error(f"Failed to send email notification: {e}", exc_info=True)
+        logger.error("Failed to send email notification: %s", e, exc_info=True)
 
 
 def send_error_notification(config, error_type, filepath, error_message):
     """
     Sends an error notification.
 
+    Errors of the same type are emailed at most once per
+    notifications.email.error_interval seconds (default 60); the next email
+    reports how many were suppressed in between.
+
     Args:
         config (dict): Application configuration
         error_type (str): Error type
         filepath (str): File path
         error_message (str): Error description
     """
+    email_config = config.get('notifications', {}).get('email', {})
+    if not email_config.get('enabled', False):
+        logger.debug("Email notifications are disabled")
+        return
+
+    # One email per error type and interval: a failure that hits every file
+    # must not turn into a flood of emails. The error text is not part of the
+    # key, as it often names the file ("Logger rejected <name>: ...")
+    error_text = str(error_message)
+    suppressed = _claim_error_email(error_type, email_config.get('error_interval', ERROR_EMAIL_INTERVAL))
+    if suppressed is None:
+        logger.debug("Error email suppressed: %s", error_type)
+        return
+
     subject = f"{error_type} Error"
     message = f"""
 File: {filepath}
-Error: {error_message}
+Error: {error_text}
 
 This is an automated notification from Watcher Service.
     """.strip()
 
+    if suppressed:
+        message += f"\n\n{suppressed} similar error notification(s) were suppressed since the previous email."
+
     send_email_notification(config, subject, message)
 
 
@@ -4,10 +4,27 @@ Syslog notifications
 
 import logging
 import socket
+import threading
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# One UDP socket, created on first use, serves every notification. It is
+# connect()ed to the server, so the address is resolved once per (host, port)
+# and each message is a plain send()
+_syslog_sock = None
+_syslog_peer = None
+_syslog_lock = threading.Lock()
+
+# The hostname does not change while the service runs
+HOSTNAME = socket.gethostname()
+
+# local0
+SYSLOG_FACILITY = 16
+
+# Part of the header after the timestamp: " hostname tag: "
+_SYSLOG_TAG = f" {HOSTNAME} watcher-service: ".encode('utf-8')
+
 # Syslog severity levels
 SYSLOG_EMERGENCY = 0
 SYSLOG_ALERT = 1
@@ -18,6 +35,41 @@ SYSLOG_NOTICE = 5
 SYSLOG_INFO = 6
 SYSLOG_DEBUG = 7
 
+# "<priority>" header prefix for each severity level
+_PRIORITY_PREFIXES = tuple(f"<{SYSLOG_FACILITY * 8 + level}>".encode('ascii') for level in range(8))
+
+
+def _get_syslog_socket(host, port):
+    """Returns the shared UDP socket, connected to (host, port), creating it on first use"""
+    global _syslog_sock, _syslog_peer
+
+    sock = _syslog_sock
+    if sock is not None and _syslog_peer == (host, port):
+        return sock
+
+    with _syslog_lock:
+        if _syslog_sock is None:
+            _syslog_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        # Connected again when the host or port is changed through the Web UI
+        if _syslog_peer != (host, port):
+            sockaddr = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+            _syslog_sock.connect(sockaddr)
+            _syslog_peer = (host, port)
+
+        return _syslog_sock
+
+
+def _reset_syslog_socket():
+    """Drops the socket, so the next send creates and connects a new one"""
+    global _syslog_sock, _syslog_peer
+
+    with _syslog_lock:
+        if _syslog_sock is not None:
+            _syslog_sock.close()
+        _syslog_sock = None
+        _syslog_peer = None
+
 
 def send_syslog_notification(config, level, message):
     """
@@ -28,34 +80,36 @@ def send_syslog_notification(config, level, message):
         level (int): Severity level (0-7)
         message (str): Message text
     """
-    if not config['notifications']['syslog']['enabled']:
+    syslog_config = config['notifications']['syslog']
+    if not syslog_config['enabled']:
         logger.debug("Syslog notifications are disabled")
         return
 
     try:
-        syslog_config = config['notifications']['syslog']
-
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
         # Format syslog: <priority>timestamp hostname tag: message
-        facility = 16  # local0
-        priority = facility * 8 + level
-
         timestamp = datetime.now().strftime('%b %d %H:%M:%S')
-        hostname = socket.gethostname()
-
-        syslog_msg = f"<{priority}>{timestamp} {hostname} watcher-service: {message}"
-
-        sock.sendto(
-            syslog_msg.encode('utf-8'),
-            (syslog_config['host'], syslog_config['port'])
-        )
 
-        sock.close()
-        logger.debug(f"Syslog notification sent: {message[:50]}...")
+        syslog_msg = b''.join((
+            _PRIORITY_PREFIXES[level],
+            timestamp.encode('ascii'),
+            _SYSLOG_TAG,
+            message.encode('utf-8')
+        ))
+
+        sock = _get_syslog_socket(syslog_config['host'], syslog_config['port'])
+        try:
+            sock.send(syslog_msg)
+        except OSError:
+            # Socket or address gone stale (e.g. the host's IP changed, or an
+            # earlier datagram was refused): rebuild once and retry
+            _reset_syslog_socket()
+            sock = _get_syslog_socket(syslog_config['host'], syslog_config['port'])
+            sock.send(syslog_msg)
+
+        logger.debug("Syslog notification sent: %.50s...", message)
 
     except Exception as e:
-        logger.error(f"Failed to send syslog notification: {e}")
+        logger.error("Failed to send syslog notification: %s", e)
 
 
 def send_syslog_error(config, error_message):
@@ -2,14 +2,17 @@
 File system event handler
 """
 
+import os
+import re
 import time
 import logging
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.events import FileSystemEventHandler
 
 from file_processing.metadata import extract_metadata, validate_metadata
 from file_processing.file_mover import move_file_to_processed
-from integration.logger_client import send_metadata_to_logger
+from integration.metadata_batcher import send_metadata, stop_retries
 from notifications.email_sender import send_success_notification, send_error_notification
 from notifications.syslog_sender import send_syslog_success, send_syslog_error
 from core.stats import stats
@@ -17,6 +20,54 @@ from core.stats import stats
 logger = logging.getLogger(__name__)
 
 
+def _ignored_files_regex(patterns):
+    """Compiles the watcher.ignored_files substrings into one regex, or None if there are none"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+def wait_until_stable(filepath, interval=0.05, timeout=5.0, written=None):
+    """
+    Waits for a file to stop changing
+
+    The size and mtime are sampled every interval seconds; the file is
+    considered written once two consecutive samples match. Gives up
+    waiting after timeout seconds and lets the file be processed anyway.
+
+    Args:
+        filepath (str): File path
+        interval (float): Seconds between samples
+        timeout (float): Maximum seconds to wait
+        written (threading.Event): Optional; once set (the writer closed the
+            file), the wait ends without further sampling
+
+    Returns:
+        bool: False if the file disappeared, True otherwise
+    """
+    deadline = time.monotonic() + timeout
+    last = None
+
+    while True:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return False
+
+        if written is not None and written.is_set():
+            return True
+
+        current = (stat.st_size, stat.st_mtime_ns)
+        if current == last or time.monotonic() >= deadline:
+            return True
+
+        last = current
+        if written is not None:
+            written.wait(interval)
+        else:
+            time.sleep(interval)
+
+
 class FileWatcherHandler(FileSystemEventHandler):
     """File system event handler"""
 
@@ -28,7 +79,45 @@ class FileWatcherHandler(FileSystemEventHandler):
             config (dict): Application configuration
         """
         self.config = config
-        self.processing_files = set()  # To prevent duplication
+        # The watcher section is updated in place by PUT /config/watcher
+        self.watcher_config = config['watcher']
+        # ignored_files list the regex was compiled from: a list set through
+        # the Web UI is a new object, so one identity check per event detects it
+        self._ignored_files = None
+        self._ignored_regex = None
+        # Files queued or being processed (to prevent duplication), each with
+        # an Event set when the writer closes the file
+        self.processing_files = {}
+        self.processing_lock = threading.Lock()
+
+        # Files are processed on worker threads so hashing and uploads of a burst
+        # overlap and the observer thread is never blocked. Each worker is a
+        # single-thread executor; a path always maps to the same worker, so
+        # events for one file are handled in order.
+        parallelism = max(1, config['watcher'].get('parallelism', 4))
+        self.workers = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'file-worker-{i}')
+            for i in range(parallelism)
+        ]
+
+    def shutdown(self):
+        """
+        Stops the worker threads once every queued file has been processed
+
+        Queued files are not cancelled: nothing rescans the watch directory
+        on the next start, so a dropped file would stay there unprocessed.
+        The metadata batcher keeps running until the workers are done, as
+        each worker waits for its own upload. Uploads are no longer retried:
+        during a Logger Service outage, files fail at once and stay in the
+        watch directory instead of each waiting out its backoff.
+        """
+        stop_retries()
+
+        # Stop accepting work on every worker first, then wait for all of them
+        for worker in self.workers:
+            worker.shutdown(wait=False)
+        for worker in self.workers:
+            worker.shutdown(wait=True)
 
     def on_created(self, event):
         """
@@ -42,37 +131,77 @@ class FileWatcherHandler(FileSystemEventHandler):
             return
 
         filepath = event.src_path
-        filename = Path(filepath).name
+        filename = os.path.basename(filepath)
 
         # Ignoring service files
-        ignored_patterns = self.config['watcher'].get('ignored_files', [])
-        if any(pattern in filename for pattern in ignored_patterns):
-            logger.debug(f"Ignoring configured file: {filename}")
+        ignored_files = self.watcher_config.get('ignored_files')
+        if ignored_files is not self._ignored_files:
+            self._ignored_regex = _ignored_files_regex(ignored_files)
+            self._ignored_files = ignored_files
+
+        ignored_regex = self._ignored_regex
+        if ignored_regex is not None and ignored_regex.search(filename):
+            logger.debug("Ignoring configured file: %s", filename)
             return
 
         # We check that the file is not being processed.
-        if filepath in self.processing_files:
-            return
+        with self.processing_lock:
+            if filepath in self.processing_files:
+                return
 
-        logger.info(f"📁 New file detected: {filepath}")
+            # Adding to processing
+            written = threading.Event()
+            self.processing_files[filepath] = written
 
-        # Adding to processing
-        self.processing_files.add(filepath)
+        logger.info("📁 New file detected: %s", filepath)
 
-        # There is a slight delay for the file to finish writing.
-        time.sleep(0.5)
+        worker = self.workers[hash(filepath) % len(self.workers)]
+        try:
+            worker.submit(self._process_new_file, filepath, written)
+        except RuntimeError:
+            # Workers already shut down: nothing will remove the entry
+            with self.processing_lock:
+                self.processing_files.pop(filepath, None)
+            logger.warning("Not processing %s: the watcher is stopping", filepath)
 
-        # Проверяем что файл еще существует
-        if not Path(filepath).exists():
-            logger.warning(f"File disappeared: {filepath}")
-            self.processing_files.discard(filepath)
-            return
+    def on_closed(self, event):
+        """
+        Called when a file opened for writing is closed (inotify IN_CLOSE_WRITE).
+
+        Ends the stability wait of a queued file early. Not emitted by the
+        polling observer or for files moved into the directory; those rely
+        on the size/mtime sampling alone.
 
-        # Processing a file
-        self.process_file(filepath)
+        Args:
+            event: File system event
+        """
+        with self.processing_lock:
+            written = self.processing_files.get(event.src_path)
 
-        # Removing from processing
-        self.processing_files.discard(filepath)
+        if written is not None:
+            written.set()
+
+    def _process_new_file(self, filepath, written=None):
+        """
+        Waits for a new file to be written, then processes it. Runs on a worker thread.
+
+        Args:
+            filepath (str): File path
+            written (threading.Event): Set by on_closed when the writer closes the file
+        """
+        try:
+            # Wait for the file to finish writing; also checks that it still exists
+            if not wait_until_stable(filepath, written=written):
+                logger.warning("File disappeared: %s", filepath)
+                return
+
+            # Processing a file
+            self.process_file(filepath)
+
+        finally:
+            # Removing from processing
+            with self.processing_lock:
+                self.processing_files.pop(filepath, None)
 
     def process_file(self, filepath):
         """
@@ -83,11 +212,17 @@ class FileWatcherHandler(FileSystemEventHandler):
         """
         try:
             # 1. Extracting metadata
-            logger.debug(f"Extracting metadata from: {filepath}")
-            metadata = extract_metadata(filepath)
+            logger.debug("Extracting metadata from: %s", filepath)
+            watcher_config = self.watcher_config
+            mmap_hash_min_mb = watcher_config.get('mmap_hash_min_mb', 0)
+            metadata = extract_metadata(
+                filepath,
+                mmap_threshold=mmap_hash_min_mb * 1024 * 1024 if mmap_hash_min_mb else None,
+                algorithm=watcher_config.get('hash_algorithm', 'sha256')
+            )
 
             if not metadata or not validate_metadata(metadata):
-                logger.error(f"Failed to extract valid metadata from: {filepath}")
+                logger.error("Failed to extract valid metadata from: %s", filepath)
                 stats.increment_failed()
                 send_error_notification(
                     self.config,
@@ -98,11 +233,11 @@ class FileWatcherHandler(FileSystemEventHandler):
                 return
 
             # 2. We send to Logger Service
-            logger.debug(f"Sending metadata to Logger Service")
-            success, response = send_metadata_to_logger(metadata, self.config)
+            logger.debug("Sending metadata to Logger Service")
+            success, response = send_metadata(metadata, self.config)
 
             if not success:
-                logger.error(f"Failed to send metadata: {response}")
+                logger.error("Failed to send metadata: %s", response)
                 stats.increment_failed()
                 send_error_notification(
                     self.config,
@@ -115,11 +250,11 @@ class FileWatcherHandler(FileSystemEventHandler):
                 return
 
             # 3. Move the file to processed
-            logger.debug(f"Moving file to processed directory")
+            logger.debug("Moving file to processed directory")
             moved, new_path = move_file_to_processed(filepath, self.config)
 
             if not moved:
-                logger.error(f"Failed to move file: {filepath}")
+                logger.error("Failed to move file: %s", filepath)
                 stats.increment_failed()
                 send_error_notification(
                     self.config,
@@ -131,16 +266,16 @@ class FileWatcherHandler(FileSystemEventHandler):
 
             # ✅ Success!
             stats.increment_processed()
-            logger.info(f"✅ Successfully processed: {metadata['filename']}")
-            logger.info(f"   Size: {metadata['file_size']} bytes")
-            logger.info(f"   Hash: {metadata['hash'][:10]}...")
-            logger.info(f"   Moved to: {new_path}")
+            logger.info("✅ Successfully processed: %s", metadata['filename'])
+            logger.info("   Size: %d bytes", metadata['file_size'])
+            logger.info("   Hash: %.10s...", metadata['hash'])
+            logger.info("   Moved to: %s", new_path)
 
             send_success_notification(self.config, metadata['filename'], metadata)
 
         except Exception as e:
             stats.increment_failed()
-            logger.error(f"Error processing file {filepath}: {e}")
+            logger.error("Error processing file %s: %s", filepath, e)
             send_error_notification(
                 self.config,
                 "File Processing Error",
@@ -2,37 +2,135 @@
 Observer setup for monitoring the file system
 """
 
+import os
+import sys
+import time
 import logging
 from pathlib import Path
-from watchdog.observers.polling import PollingObserver
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingEmitter
 from .file_watcher import FileWatcherHandler
 
 logger = logging.getLogger(__name__)
 
+# Directory mtimes closer than this to the time of a walk are not trusted to
+# show later changes (FAT and SMB store mtimes in steps of up to 2 seconds)
+MTIME_GRANULARITY_NS = 2_000_000_000
+
+
+class DirectoryPollingEmitter(PollingEmitter):
+    """
+    PollingEmitter that skips the directory walk while the directory is unchanged
+
+    Creating, deleting or renaming an entry updates the directory's mtime,
+    so for a non-recursive watch an unchanged mtime means no file was added
+    and the listing and stat results of the last walk are replayed: one
+    stat per poll instead of one per file. Changes to the content of existing files are not seen in
+    that case; the handler only reacts to new files.
+
+    As with git's racily-clean index entries, an mtime within
+    MTIME_GRANULARITY_NS of the last walk is not trusted, since a change
+    right after the walk could leave it unchanged.
+    """
+
+    def __init__(self, event_queue, watch, **kwargs):
+        # (st_ino, st_mtime_ns) of the directory at the last walk, and when the walk started
+        self._last_walk = None
+        self._walk_key = None
+        self._reuse_walk = False
+        # Entries and stat results of the last walk, reused while the directory is unchanged
+        self._entries = []
+        self._stats = {}
+
+        # Served through the public stat/listdir hooks of PollingEmitter, which
+        # its DirectorySnapshot calls as: stat(root), listdir(root), then
+        # stat() per entry (watchdog 6.0). Recursive watches keep the defaults
+        if not watch.is_recursive:
+            kwargs.update(stat=self._stat, listdir=self._listdir)
+
+        super().__init__(event_queue, watch, **kwargs)
+
+    def _stat(self, path):
+        """stat hook: decides on the directory stat whether the last walk is reused"""
+        if path != self.watch.path:
+            if self._reuse_walk:
+                try:
+                    return self._stats[path]
+                except KeyError:
+                    raise FileNotFoundError(path) from None
+
+            st = os.stat(path)
+            self._stats[path] = st
+            return st
+
+        st = os.stat(path)
+        key = (st.st_ino, st.st_mtime_ns)
+        self._reuse_walk = (self._last_walk is not None
+                            and self._last_walk[0] == key
+                            and st.st_mtime_ns < self._last_walk[1] - MTIME_GRANULARITY_NS)
+
+        if not self._reuse_walk:
+            self._walk_key = (key, time.time_ns())
+        return st
+
+    def _listdir(self, path):
+        """listdir hook: lists the directory, or replays the last listing while it is unchanged"""
+        if self._reuse_walk:
+            return iter(self._entries)
+
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        self._entries = entries
+        self._stats = {}
+        # Reusable from the next poll on, once the listing has succeeded
+        self._last_walk = self._walk_key
+        return iter(entries)
+
+
+class DirectoryPollingObserver(BaseObserver):
+    """Polling observer built on DirectoryPollingEmitter"""
+
+    def __init__(self, *, timeout=1):
+        super().__init__(DirectoryPollingEmitter, timeout=timeout)
+
 
 def setup_observer(config, app_logger):
     """
-    Creates and configures a PollingObserver to monitor a directory
+    Creates and configures an observer to monitor a directory
+
+    The native observer (inotify on Linux, FSEvents on macOS) is used where
+    available. Polling is used on Windows, and when watcher.force_polling is
+    set, e.g. for Docker bind mounts from a Windows host that do not deliver
+    inotify events.
 
     Args:
         config (dict): Application configuration
         app_logger: Application logger object
 
     Returns:
-        PollingObserver: Configured observer
+        BaseObserver: Configured observer
     """
-    watch_dir = Path(config['watcher']['watch_directory'])
+    watcher_config = config['watcher']
+    watch_dir = Path(watcher_config['watch_directory'])
 
     # Create the event handler
     event_handler = FileWatcherHandler(config)
 
-    # Create the observer (PollingObserver is used for Windows/Docker compatibility)
-    observer = PollingObserver()
+    # Create the observer
+    if sys.platform.startswith('win') or watcher_config.get('force_polling', False):
+        observer = DirectoryPollingObserver(timeout=watcher_config.get('check_interval', 1))
+    else:
+        observer = Observer()
 
     # Set up directory monitoring
     observer.schedule(event_handler, str(watch_dir), recursive=False)
 
-    logger.info(f"Observer configured for: {watch_dir}")
+    # Kept for stop_observer, which shuts down the handler's workers
+    observer.file_handler = event_handler
+
+    logger.info(f"{type(observer).__name__} configured for: {watch_dir}")
 
     return observer
 
@@ -50,11 +148,15 @@ def start_observer(observer):
 
 def stop_observer(observer):
     """
-    Stops the observer
+    Stops the observer, then the file handler's worker threads
 
     Args:
         observer: Observer object
     """
     observer.stop()
     observer.join()
+
+    file_handler = getattr(observer, 'file_handler', None)
+    if file_handler is not None:
+        file_handler.shutdown()
     logger.info("Observer stopped")
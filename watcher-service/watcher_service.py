@@ -2,16 +2,17 @@
 Watcher Service - JWT File System
 """
 
-import time
+import os
+import signal
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
 
-from core.config import load_config
+from core.config import load_config, YAML_BACKEND
 from core.logger import setup_logging
 from core.stats import stats
-from watcher.observer import setup_observer
+from watcher.observer import setup_observer, stop_observer
 from api.app import create_app
-from integration.logger_client import test_logger_connection
+from integration.logger_client import test_logger_connection, close_http_session
 
 
 def main():
@@ -33,6 +34,7 @@ def main():
     logger.info(f"📧 Email notifications: {'enabled' if config['notifications']['email']['enabled'] else 'disabled'}")
     logger.info(f"📡 Syslog notifications: {'enabled' if config['notifications']['syslog']['enabled'] else 'disabled'}")
     logger.info(f"🌐 Web UI: http://0.0.0.0:8080/")
+    logger.info(f"📄 YAML parser: {YAML_BACKEND}")
     logger.info("=" * 60)
 
     # Create the necessary directories
@@ -42,6 +44,13 @@ def main():
     watch_dir.mkdir(parents=True, exist_ok=True)
     processed_dir.mkdir(parents=True, exist_ok=True)
 
+    # Moves within one filesystem are a rename; across filesystems every file is copied
+    if watch_dir.stat().st_dev != processed_dir.stat().st_dev:
+        logger.warning(
+            "⚠️ Watch and processed directories are on different filesystems: "
+            "processed files will be copied instead of renamed"
+        )
+
     logger.info(f"✅ Directories ready")
 
     # Checking availability Logger Service
@@ -56,21 +65,37 @@ def main():
     web_app = create_app(config, logger, stats)
 
     def run_web_app():
-        web_app.run(host='0.0.0.0', port=8080, debug=False, use_reloader=False)
+        if config['service'].get('debug', False):
+            # Flask's development server (no reloader: it would restart the watcher too)
+            web_app.run(host='0.0.0.0', port=8080, debug=True, use_reloader=False)
+        else:
+            # Production WSGI server with a pool of worker threads
+            from waitress import serve
+
+            threads = config['service'].get('threads', 8)
+            logger.info(f"🧵 Serving Web UI with waitress ({threads} threads)")
+            serve(web_app, host='0.0.0.0', port=8080, threads=threads)
 
     web_thread = Thread(target=run_web_app, daemon=True) # separate thread!!!
     web_thread.start()
     logger.info("🌐 Web UI started on http://0.0.0.0:8080")
 
-    try:
-        while True:
-            time.sleep(1)
+    # Ctrl+C and SIGTERM (docker stop, systemd) both stop the service
+    stop_event = Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    # Sleeps until a signal arrives. On Windows a blocking wait cannot be
+    # interrupted, so it wakes once a second to let the handlers run
+    while not stop_event.wait(None if os.name == 'posix' else 1):
+        pass
 
-    except KeyboardInterrupt:
-        logger.info("🛑 Stopping watcher service...")
-        observer.stop()
+    logger.info("🛑 Stopping watcher service...")
 
-    observer.join()
+    # No new events, then every queued file is finished before the
+    # Logger Service connections are closed
+    stop_observer(observer)
+    close_http_session()
     logger.info("👋 Watcher service stopped")
 
 